@@ -12,35 +12,35 @@ Usage:
     ./generate_positive_audio_clips.py -n 5         # Sample 5 messages from the file
     ./generate_positive_audio_clips.py -e 0.65      # Single version at exaggeration 0.65
     ./generate_positive_audio_clips.py "Hi" "Bye"   # Custom strings (bypass file)
+    ./generate_positive_audio_clips.py --concat all.wav   # One combined file
     cat messages.txt | ./generate_positive_audio_clips.py   # Read from stdin
 """
 
 import sys
 import os
 import argparse
+import dataclasses
+import functools
 import random
+import re
+from concurrent.futures import ThreadPoolExecutor
 
-# Suppress warnings before importing torch
+# Set before torch is (lazily) imported
 os.environ["PYTORCH_ENABLE_MPS_FALLBACK"] = "1"
-
-# Fix perth watermarker issue
-import perth
-if perth.PerthImplicitWatermarker is None:
-    perth.PerthImplicitWatermarker = perth.DummyWatermarker
-
-import torch
-import torchaudio as ta
-from chatterbox.tts import ChatterboxTTS
+# Load CUDA kernels on first use instead of all at context creation
+os.environ.setdefault("CUDA_MODULE_LOADING", "LAZY")
 
 
 REFERENCE_FILE = "voice_reference.wav"
 DEFAULT_OUTPUT_DIR = "spoken_affirmations"
 MESSAGES_FILE = "positive_messages.txt"
+COMPILE_CACHE_FILE = "compile_cache.bin"
 
 EXAGGERATION_LEVELS = [0.65, 0.8, 0.9]
+WARMUP_TEXT = "Warming up."
 
 # Stock positive affirmations (used to generate default file)
-STOCK_MESSAGES = [
+STOCK_MESSAGES = (
     "I am worthy of love and respect, exactly as I am.",
     "My voice matters, and what I have to say is important.",
     "I trust myself to handle whatever comes my way.",
@@ -76,12 +76,19 @@ STOCK_MESSAGES = [
     "I am creating a life that feels good on the inside.",
     "I honor my boundaries and respect myself.",
     "I am exactly where I need to be right now.",
-]
+)
 
 DEFAULT_SAMPLE_COUNT = -1  # -1 means all messages
+SAVE_WORKERS = 2  # background threads writing finished clips to disk
+CONCAT_GAP_SEC = 0.5  # silence between clips in --concat output
+
+# Anything other than letters, digits, spaces, hyphens and underscores
+UNSAFE_FILENAME_CHARS = re.compile(r"[^\w -]")
 
 
 def get_device():
+    import torch
+
     if torch.cuda.is_available():
         return "cuda"
     elif torch.backends.mps.is_available():
@@ -89,22 +96,108 @@ def get_device():
     return "cpu"
 
 
+def autocast_t3(model, device, enabled):
+    """
+    Run T3 token generation under bfloat16 autocast on supported CUDA GPUs.
+
+    Only model.t3.inference is wrapped; the S3Gen vocoder that turns its
+    speech tokens into audio stays in float32. Elsewhere this is a no-op.
+    """
+    import torch
+
+    if not (enabled and device == "cuda" and torch.cuda.is_bf16_supported()):
+        return
+
+    inference = model.t3.inference
+
+    @functools.wraps(inference)
+    def bf16_inference(*args, **kwargs):
+        with torch.autocast(device_type="cuda", dtype=torch.bfloat16):
+            return inference(*args, **kwargs)
+
+    model.t3.inference = bf16_inference
+
+
+def load_chatterbox():
+    """
+    Import Chatterbox on demand and return the ChatterboxTTS class.
+
+    torch and chatterbox take seconds to import, so this runs only once
+    arguments are parsed and the inputs are known to exist.
+    """
+    # Fix perth watermarker issue (use dummy if real one unavailable).
+    # SKIP_WATERMARK=1 opts out of the per-clip watermark pass as well.
+    import perth
+    if os.environ.get("SKIP_WATERMARK") == "1" or perth.PerthImplicitWatermarker is None:
+        perth.PerthImplicitWatermarker = perth.DummyWatermarker
+
+    from chatterbox.tts import ChatterboxTTS
+    return ChatterboxTTS
+
+
+def compile_model(model):
+    """
+    Compile the T3 transformer with torch.compile.
+
+    Inductor artifacts saved by a previous run are loaded first, so only the
+    first --compile run pays the full compile cost.
+    """
+    import torch
+
+    if hasattr(torch.compiler, "load_cache_artifacts") and os.path.exists(COMPILE_CACHE_FILE):
+        with open(COMPILE_CACHE_FILE, "rb") as f:
+            torch.compiler.load_cache_artifacts(f.read())
+        print(f"Loaded compile cache from {COMPILE_CACHE_FILE}")
+
+    # Sequence length grows every decode step, so compile for dynamic shapes
+    # rather than specializing (and recompiling) per length
+    model.t3.tfmr.forward = torch.compile(model.t3.tfmr.forward, dynamic=True)
+
+
+def save_compile_cache():
+    """Persist Inductor artifacts for the next --compile run."""
+    import torch
+
+    if not hasattr(torch.compiler, "save_cache_artifacts"):
+        return
+    saved = torch.compiler.save_cache_artifacts()
+    if saved is None:
+        return
+    artifacts, _ = saved
+    with open(COMPILE_CACHE_FILE, "wb") as f:
+        f.write(artifacts)
+    print(f"Saved compile cache to {COMPILE_CACHE_FILE}")
+
+
+def cache_text_tokens(model):
+    """
+    Tokenize each message once instead of once per exaggeration level.
+
+    Chatterbox has no separate text encoder to reuse: T3 embeds the text
+    tokens after the exaggeration-dependent conditioning prefix, so every
+    level needs its own decoder pass. What does repeat is tokenization, and
+    since build_jobs keeps a message's levels adjacent, remembering the last
+    result is enough.
+    """
+    model.tokenizer.text_to_tokens = functools.lru_cache(maxsize=1)(model.tokenizer.text_to_tokens)
+
+
 def sanitize_filename(text, max_len=40):
     """Convert text to a safe filename."""
-    safe = "".join(c if c.isalnum() or c in " -_" else "" for c in text)
+    safe = UNSAFE_FILENAME_CHARS.sub("", text)
     safe = safe.strip().replace(" ", "_").lower()
-    return safe[:max_len] if len(safe) > max_len else safe
+    return safe[:max_len]
+
+
+def parse_message_lines(lines):
+    """Return the stripped, non-blank lines that aren't # comments."""
+    return [line for line in (raw.strip() for raw in lines) if line and line[0] != '#']
 
 
 def load_messages_from_file(filepath):
     """Load messages from a text file, one per line."""
-    messages = []
     with open(filepath, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                messages.append(line)
-    return messages
+        return parse_message_lines(f)
 
 
 def generate_messages_file(filepath):
@@ -120,12 +213,7 @@ def generate_messages_file(filepath):
 
 def read_from_stdin():
     """Read messages from stdin, one per line."""
-    messages = []
-    for line in sys.stdin:
-        line = line.strip()
-        if line and not line.startswith('#'):
-            messages.append(line)
-    return messages
+    return parse_message_lines(sys.stdin)
 
 
 def get_messages(args):
@@ -158,6 +246,55 @@ def get_messages(args):
     sys.exit(0)
 
 
+def build_jobs(messages, exag_levels):
+    """
+    Flatten messages x exaggeration levels into generation jobs.
+
+    Returns a list of (message_index, text, exaggeration, filename) tuples,
+    with all levels for a message kept adjacent.
+    """
+    jobs = []
+    for i, text in enumerate(messages, 1):
+        for exag in exag_levels:
+            if len(exag_levels) > 1:
+                exag_label = f"e{int(exag * 100)}"
+                filename = f"{i:02d}_{sanitize_filename(text)}_{exag_label}.wav"
+            else:
+                filename = f"{i:02d}_{sanitize_filename(text)}.wav"
+            jobs.append((i, text, exag, filename))
+    return jobs
+
+
+def build_exaggeration_conds(model, exag_levels):
+    """
+    Precompute T3 conditioning for each exaggeration level.
+
+    The speaker embedding and prompt tokens from prepare_conditionals() are
+    shared; only emotion_adv differs. Without this, generate() rebuilds and
+    re-uploads its conditioning every time the level changes, which with
+    build_jobs' ordering is every clip.
+    """
+    import torch
+
+    base = model.conds.t3
+    return {
+        exag: dataclasses.replace(base, emotion_adv=torch.full((1, 1, 1), exag, device=model.device))
+        for exag in exag_levels
+    }
+
+
+def generate_clip(model, text, exaggeration, exag_conds=None):
+    """
+    Generate one waveform for text at the given exaggeration.
+
+    exag_conds (from build_exaggeration_conds) swaps in the level's
+    conditioning instead of letting generate() rebuild it.
+    """
+    if exag_conds is not None:
+        model.conds.t3 = exag_conds[exaggeration]
+    return model.generate(text, exaggeration=exaggeration)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate audio files from text strings")
     parser.add_argument("messages", nargs="*", help="Text strings to speak (overrides file)")
@@ -167,6 +304,12 @@ def main():
                         help=f"Output directory (default: {DEFAULT_OUTPUT_DIR})")
     parser.add_argument("-e", "--exaggeration", type=float, default=None,
                         help="Emotion exaggeration (0-1). If omitted, generates 0.65, 0.8, and 0.9 versions")
+    parser.add_argument("--compile", action="store_true",
+                        help=f"Compile the model with torch.compile (cached in {COMPILE_CACHE_FILE})")
+    parser.add_argument("--bf16", action="store_true",
+                        help="Run T3 token generation under bfloat16 autocast (CUDA only); the vocoder stays float32")
+    parser.add_argument("--concat", metavar="FILE", default=None,
+                        help="Write all clips into one WAV file, separated by short silences")
     args = parser.parse_args()
 
     messages = get_messages(args)
@@ -177,54 +320,104 @@ def main():
         messages = random.sample(messages, sample_count)
         print(f"Sampled {sample_count} of {total} messages")
 
+    if not messages:
+        print("No messages to generate.")
+        return
+
     # Check reference file
     if not os.path.exists(REFERENCE_FILE):
         print(f"Error: {REFERENCE_FILE} not found.")
         print("Run ./prepare.py first to create your voice reference.")
         sys.exit(1)
 
-    # Create output directory
-    os.makedirs(args.output_dir, exist_ok=True)
+    # Create output directory; --concat writes a single file instead
+    if not args.concat:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    import torch
+    import torchaudio as ta
+    ChatterboxTTS = load_chatterbox()
 
     device = get_device()
     print(f"Device: {device}")
     print(f"Loading model...")
 
     model = ChatterboxTTS.from_pretrained(device=device)
+    cache_text_tokens(model)
 
     if args.exaggeration is not None:
         exag_levels = [args.exaggeration]
     else:
         exag_levels = EXAGGERATION_LEVELS
 
+    # Encode the voice reference once; generate() reuses model.conds
+    print(f"Preparing voice conditioning from {REFERENCE_FILE}...")
+    model.prepare_conditionals(REFERENCE_FILE, exaggeration=exag_levels[0])
+
+    exag_conds = build_exaggeration_conds(model, exag_levels)
+
+    if args.bf16 and device != "cuda":
+        print("Note: --bf16 needs a CUDA GPU; running in float32.")
+    autocast_t3(model, device, args.bf16)
+
+    if args.compile:
+        print("Compiling model (first run may take a minute)...")
+        compile_model(model)
+
+    # With --compile the first generate() triggers compilation; run it on a
+    # throwaway text so the compile cache can be saved before the real clips
+    if args.compile:
+        print("Warming up...")
+        with torch.inference_mode():
+            model.generate(WARMUP_TEXT, exaggeration=exag_levels[0])
+        save_compile_cache()
+
     total_files = len(messages) * len(exag_levels)
     if len(exag_levels) > 1:
         print(f"\nGenerating {total_files} audio files ({len(messages)} messages × {len(exag_levels)} exaggeration levels)...\n")
     else:
         print(f"\nGenerating {total_files} audio files (exaggeration={exag_levels[0]})...\n")
 
-    generated_files = []
-    for i, text in enumerate(messages, 1):
-        print(f"[{i}/{len(messages)}] \"{text[:50]}{'...' if len(text) > 50 else ''}\"")
+    jobs = build_jobs(messages, exag_levels)
+
+    # WAV encoding and disk writes run on worker threads so the next
+    # generate call doesn't wait on them. inference_mode covers the whole
+    # loop so no autograd bookkeeping happens between generate calls either.
+    pending = {}
+    concat_chunks = []
+    current_message = None
+    with torch.inference_mode(), ThreadPoolExecutor(max_workers=SAVE_WORKERS) as save_pool:
+        for i, text, exag, filename in jobs:
+            if i != current_message:
+                current_message = i
+                print(f"[{i}/{len(messages)}] \"{text[:50]}{'...' if len(text) > 50 else ''}\"")
+
+            wav = generate_clip(model, text, exag, exag_conds).cpu()
+            duration = wav.shape[1] / model.sr
+            if args.concat:
+                concat_chunks.append(wav)
+                print(f"         -> {args.concat} ({duration:.1f}s)")
+                continue
 
-        for exag in exag_levels:
-            if len(exag_levels) > 1:
-                exag_label = f"e{int(exag * 100)}"
-                filename = f"{i:02d}_{sanitize_filename(text)}_{exag_label}.wav"
-            else:
-                filename = f"{i:02d}_{sanitize_filename(text)}.wav"
             output_path = os.path.join(args.output_dir, filename)
-
-            wav = model.generate(
-                text,
-                audio_prompt_path=REFERENCE_FILE,
-                exaggeration=exag,
-            )
-
-            ta.save(output_path, wav, model.sr)
-            duration = wav.shape[1] / model.sr
+            pending[output_path] = save_pool.submit(ta.save, output_path, wav, model.sr)
             print(f"         -> {filename} ({duration:.1f}s)")
-            generated_files.append(output_path)
+
+    if args.concat:
+        silence = torch.zeros(1, int(CONCAT_GAP_SEC * model.sr))
+        combined = []
+        for wav in concat_chunks:
+            if combined:
+                combined.append(silence)
+            combined.append(wav)
+        ta.save(args.concat, torch.cat(combined, dim=1), model.sr)
+        print(f"\nDone! Wrote {len(concat_chunks)} clips to {args.concat}")
+        return
+
+    # Surface any write errors
+    for future in pending.values():
+        future.result()
+    generated_files = list(pending)
 
     print(f"\nDone! Generated {len(generated_files)} files in {args.output_dir}/")
 
@@ -48,12 +48,12 @@ echo "Setting up recording environment (venv)..."
 if [ "$USE_UV" = true ]; then
     uv venv venv --python 3.11 --quiet
     source venv/bin/activate
-    uv pip install pydub sounddevice soundfile numpy --quiet
+    uv pip install pydub sounddevice soundfile numpy scipy --quiet
 else
     python3 -m venv venv
     source venv/bin/activate
     pip install --upgrade pip --quiet
-    pip install pydub sounddevice soundfile numpy --quiet
+    pip install pydub sounddevice soundfile numpy scipy --quiet
 fi
 deactivate
 echo "  Done: venv/"
@@ -64,12 +64,12 @@ echo "Setting up Chatterbox environment (venv-chatterbox)..."
 if [ "$USE_UV" = true ]; then
     uv venv venv-chatterbox --python 3.11 --quiet
     source venv-chatterbox/bin/activate
-    uv pip install chatterbox-tts --quiet
+    uv pip install chatterbox-tts sounddevice --quiet
 else
     python3 -m venv venv-chatterbox
     source venv-chatterbox/bin/activate
     pip install --upgrade pip --quiet
-    pip install chatterbox-tts --quiet
+    pip install chatterbox-tts sounddevice --quiet
 fi
 
 # Download the model
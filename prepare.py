@@ -8,23 +8,32 @@ Chatterbox is zero-shot, so this just selects/combines the best clips.
 import os
 import glob
 import sys
-from pydub import AudioSegment
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import soundfile as sf
 
 
 CLIPS_DIR = "voice_samples"
 REFERENCE_FILE = "voice_reference.wav"
 MIN_DURATION_SEC = 10
 MAX_DURATION_SEC = 200
+GAP_SEC = 0.5  # silence between recordings
 
 
-def get_recordings():
-    """Get all recording_*.wav files (not tone files), newest first."""
-    pattern = os.path.join(CLIPS_DIR, "recording_*.wav")
+def get_recordings(directory="."):
+    """Get all recording_*.wav files (not tone files) under directory, newest first."""
+    pattern = os.path.join(directory, CLIPS_DIR, "recording_*.wav")
     return sorted(glob.glob(pattern), reverse=True)
 
 
-def main():
-    recordings = get_recordings()
+def load_recording(path):
+    """Read a recording as int16 samples shaped (frames, channels)."""
+    audio, sample_rate = sf.read(path, dtype="int16", always_2d=True)
+    return path, audio, sample_rate
+
+
+def main(directory="."):
+    recordings = get_recordings(directory)
 
     if not recordings:
         print(f"No recordings found in {CLIPS_DIR}/")
@@ -33,14 +42,14 @@ def main():
 
     print(f"Found {len(recordings)} recording(s):\n")
 
-    # Load and show durations
-    clips = []
+    # Decode in parallel (libsndfile releases the GIL), then show durations
+    with ThreadPoolExecutor() as pool:
+        clips = list(pool.map(load_recording, recordings))
+
     total_duration = 0
-    for path in recordings:
-        audio = AudioSegment.from_file(path)
-        duration = len(audio) / 1000
+    for path, audio, sample_rate in clips:
+        duration = len(audio) / sample_rate
         total_duration += duration
-        clips.append((path, audio, duration))
         print(f"  {os.path.basename(path)}: {duration:.1f}s")
 
     print(f"\nTotal: {total_duration:.1f}s")
@@ -50,24 +59,34 @@ def main():
         print(f"\nWarning: Total duration ({total_duration:.1f}s) is short.")
         print(f"Recommend at least {MIN_DURATION_SEC}s for good voice cloning.")
 
-    # Combine all clips with small gaps
+    sample_rate = clips[0][2]
+    channels = clips[0][1].shape[1]
+    for path, audio, rate in clips:
+        if rate != sample_rate or audio.shape[1] != channels:
+            print(f"Error: {os.path.basename(path)} is {rate}Hz/{audio.shape[1]}ch, "
+                  f"expected {sample_rate}Hz/{channels}ch like the other recordings.")
+            sys.exit(1)
+
+    # Combine all clips with small gaps into one preallocated buffer
     print(f"\nCombining into {REFERENCE_FILE}...")
-    combined = AudioSegment.empty()
-    gap = AudioSegment.silent(duration=500)  # 0.5s gap between clips
+    gap = int(GAP_SEC * sample_rate)
+    total = sum(len(audio) for _, audio, _ in clips) + gap * (len(clips) - 1)
+    combined = np.zeros((total, channels), dtype=np.int16)
 
-    for i, (path, audio, duration) in enumerate(clips):
-        if i > 0:
-            combined += gap
-        combined += audio
+    offset = 0
+    for path, audio, _ in clips:
+        combined[offset:offset + len(audio)] = audio
+        offset += len(audio) + gap
 
     # Trim if too long
-    if len(combined) > MAX_DURATION_SEC * 1000:
-        print(f"Trimming to {MAX_DURATION_SEC}s (was {len(combined)/1000:.1f}s)")
-        combined = combined[:MAX_DURATION_SEC * 1000]
+    max_samples = MAX_DURATION_SEC * sample_rate
+    if len(combined) > max_samples:
+        print(f"Trimming to {MAX_DURATION_SEC}s (was {len(combined) / sample_rate:.1f}s)")
+        combined = combined[:max_samples]
 
     # Export
-    combined.export(REFERENCE_FILE, format="wav")
-    final_duration = len(combined) / 1000
+    sf.write(os.path.join(directory, REFERENCE_FILE), combined, sample_rate, subtype="PCM_16")
+    final_duration = len(combined) / sample_rate
     print(f"\nSaved: {REFERENCE_FILE} ({final_duration:.1f}s)")
     print("\nReady! Run: ./speak.py \"Your text here\"")
 
@@ -4,22 +4,24 @@
 Record audio from default input until Ctrl+C.
 """
 
+import os
+import queue
 import signal
 import sys
 import datetime
 import random
 import sounddevice as sd
 import soundfile as sf
-import numpy as np
 
 SAMPLE_RATE = 44100
 CHANNELS = 1
 
-recording = []
+# Chunks handed from the audio callback to the main thread for writing
+audio_queue = queue.Queue()
 is_recording = True
 
 # Paragraphs designed to capture varied phonemes, emotions, and speech patterns
-PARAGRAPHS = [
+PARAGRAPHS = (
     "The old lighthouse keeper walked along the rocky shore every morning, watching the waves crash against the jagged cliffs below. He had spent forty years in this place, through storms and sunshine, through joy and sorrow. The sea was his constant companion, never judging, always present.",
 
     "Scientists have discovered that the human brain processes music in a fundamentally different way than speech. When we hear a familiar melody, multiple regions light up simultaneously, creating a symphony of neural activity. This explains why certain songs can instantly transport us back to specific moments in our past.",
@@ -39,14 +41,14 @@ PARAGRAPHS = [
     "She opened the dusty book and began to read aloud, her voice filling the empty room. The words were old, written centuries ago by someone whose name had been forgotten. Yet the emotions they conveyed felt as fresh and relevant as if they had been penned yesterday.",
 
     "The marathon runner crossed the finish line with tears streaming down her face. Four years of training, countless early mornings, and moments of doubt had led to this single achievement. The crowd's cheers washed over her as she realized that the impossible had become possible.",
-]
+)
 
 
 def callback(indata, frames, time, status):
     if status:
         print(f"Status: {status}", file=sys.stderr)
     if is_recording:
-        recording.append(indata.copy())
+        audio_queue.put(indata.copy())
 
 
 def stop_recording(signum, frame):
@@ -97,22 +99,28 @@ def main():
     # Set up signal handler
     signal.signal(signal.SIGINT, stop_recording)
 
-    # Start recording
-    with sd.InputStream(samplerate=SAMPLE_RATE, channels=CHANNELS, callback=callback):
-        print("\n🎙️  RECORDING... (Ctrl+C to stop)\n")
-        while is_recording:
-            sd.sleep(100)
-
-    # Combine all recorded chunks
-    if recording:
-        audio_data = np.concatenate(recording, axis=0)
-        duration = len(audio_data) / SAMPLE_RATE
-
-        # Write to file
-        sf.write(output_file, audio_data, SAMPLE_RATE)
+    # Start recording, streaming chunks straight to disk
+    with sf.SoundFile(output_file, mode="w", samplerate=SAMPLE_RATE,
+                      channels=CHANNELS, subtype="PCM_16") as writer:
+        with sd.InputStream(samplerate=SAMPLE_RATE, channels=CHANNELS, callback=callback):
+            print("\n🎙️  RECORDING... (Ctrl+C to stop)\n")
+            while is_recording:
+                try:
+                    writer.write(audio_queue.get(timeout=0.1))
+                except queue.Empty:
+                    pass
+
+        # Write whatever arrived between Ctrl+C and the stream closing
+        while not audio_queue.empty():
+            writer.write(audio_queue.get_nowait())
+        frames = writer.frames
+
+    if frames:
+        duration = frames / SAMPLE_RATE
         print(f"\nSaved: {output_file}")
         print(f"Duration: {duration:.2f}s")
     else:
+        os.remove(output_file)
         print("No audio recorded.")
 
 
@@ -12,19 +12,14 @@ import sys
 import os
 import argparse
 import datetime
+import functools
+import shutil
 import subprocess
 
-# Suppress warnings before importing torch
+# Set before torch is (lazily) imported
 os.environ["PYTORCH_ENABLE_MPS_FALLBACK"] = "1"
-
-# Fix perth watermarker issue (use dummy if real one unavailable)
-import perth
-if perth.PerthImplicitWatermarker is None:
-    perth.PerthImplicitWatermarker = perth.DummyWatermarker
-
-import torch
-import torchaudio as ta
-from chatterbox.tts import ChatterboxTTS
+# Load CUDA kernels on first use instead of all at context creation
+os.environ.setdefault("CUDA_MODULE_LOADING", "LAZY")
 
 
 REFERENCE_FILE = "voice_reference.wav"
@@ -33,6 +28,8 @@ OUTPUT_DIR = "spoken_affirmations"
 
 def get_device():
     """Get best available device."""
+    import torch
+
     if torch.cuda.is_available():
         return "cuda"
     elif torch.backends.mps.is_available():
@@ -40,6 +37,45 @@ def get_device():
     return "cpu"
 
 
+def autocast_t3(model, device, enabled):
+    """
+    Run T3 token generation under bfloat16 autocast on supported CUDA GPUs.
+
+    Only model.t3.inference is wrapped; the S3Gen vocoder that turns its
+    speech tokens into audio stays in float32. Elsewhere this is a no-op.
+    """
+    import torch
+
+    if not (enabled and device == "cuda" and torch.cuda.is_bf16_supported()):
+        return
+
+    inference = model.t3.inference
+
+    @functools.wraps(inference)
+    def bf16_inference(*args, **kwargs):
+        with torch.autocast(device_type="cuda", dtype=torch.bfloat16):
+            return inference(*args, **kwargs)
+
+    model.t3.inference = bf16_inference
+
+
+def load_chatterbox():
+    """
+    Import Chatterbox on demand and return the ChatterboxTTS class.
+
+    torch and chatterbox take seconds to import, so this runs only once
+    arguments are parsed and the inputs are known to exist.
+    """
+    # Fix perth watermarker issue (use dummy if real one unavailable).
+    # SKIP_WATERMARK=1 opts out of the per-clip watermark pass as well.
+    import perth
+    if os.environ.get("SKIP_WATERMARK") == "1" or perth.PerthImplicitWatermarker is None:
+        perth.PerthImplicitWatermarker = perth.DummyWatermarker
+
+    from chatterbox.tts import ChatterboxTTS
+    return ChatterboxTTS
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate speech in your cloned voice")
     parser.add_argument("text", help="Text to speak")
@@ -47,6 +83,8 @@ def main():
     parser.add_argument("-e", "--exaggeration", type=float, default=0.5,
                         help="Emotion exaggeration (0-1, default 0.5)")
     parser.add_argument("--no-play", action="store_true", help="Don't play audio after generating")
+    parser.add_argument("--bf16", action="store_true",
+                        help="Run T3 token generation under bfloat16 autocast (CUDA only); the vocoder stays float32")
     args = parser.parse_args()
 
     # Check reference file exists
@@ -65,32 +103,44 @@ def main():
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         output_path = os.path.join(OUTPUT_DIR, f"speech_{timestamp}.wav")
 
+    import torch
+    import torchaudio as ta
+    ChatterboxTTS = load_chatterbox()
+
     device = get_device()
     print(f"Device: {device}")
     print(f"Loading model...")
 
     model = ChatterboxTTS.from_pretrained(device=device)
+    autocast_t3(model, device, args.bf16)
 
     print(f"Generating speech...")
     print(f"  Text: \"{args.text}\"")
     print(f"  Reference: {REFERENCE_FILE}")
     print(f"  Exaggeration: {args.exaggeration}")
 
-    wav = model.generate(
-        args.text,
-        audio_prompt_path=REFERENCE_FILE,
-        exaggeration=args.exaggeration,
-    )
+    model.prepare_conditionals(REFERENCE_FILE, exaggeration=args.exaggeration)
+    with torch.inference_mode():
+        wav = model.generate(args.text, exaggeration=args.exaggeration)
 
     # Save
     ta.save(output_path, wav, model.sr)
     duration = wav.shape[1] / model.sr
     print(f"\nSaved: {output_path} ({duration:.1f}s)")
 
-    # Play
+    # Play straight from memory; the clip is already on disk, so a missing
+    # or broken audio backend only costs the playback
     if not args.no_play:
         print("Playing...")
-        subprocess.run(["afplay", output_path])
+        try:
+            import sounddevice as sd
+            sd.play(wav.squeeze(0).numpy(), model.sr)
+            sd.wait()
+        except Exception as e:
+            if shutil.which("afplay"):
+                subprocess.run(["afplay", output_path])
+            else:
+                print(f"Warning: could not play audio ({e})")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+"""Run the Chatterbox scripts repeatedly in one venv-chatterbox interpreter.
+
+Started once per test session by the chatterbox_runner fixture. Each stdin
+line is a JSON request {"script", "args", "cwd", "stdin"}; the script runs as
+__main__ and one JSON line {"returncode", "stdout", "stderr"} is written back.
+The model is loaded on the first request and reused after that, so only one
+test pays for torch, chatterbox and the checkpoint load.
+"""
+
+import contextlib
+import io
+import json
+import operator
+import os
+import runpy
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from speak import load_chatterbox
+
+# Loaded models by device, shared by every request
+MODELS = {}
+
+# Methods the scripts wrap on the model they load (cache_text_tokens,
+# autocast_t3, compile_model). The wrappers are instance attributes, so
+# dropping them after each run restores the class methods instead of letting
+# one run's wrappers stack on the next.
+PATCHED_METHODS = (
+    ("tokenizer", "text_to_tokens"),
+    ("t3", "inference"),
+    ("t3.tfmr", "forward"),
+)
+
+
+def cache_model_loads():
+    """Make ChatterboxTTS.from_pretrained return one model per device."""
+    ChatterboxTTS = load_chatterbox()
+    load = ChatterboxTTS.from_pretrained
+
+    def from_pretrained(device):
+        if device not in MODELS:
+            MODELS[device] = load(device=device)
+        return MODELS[device]
+
+    ChatterboxTTS.from_pretrained = staticmethod(from_pretrained)
+
+
+def restore_model_methods():
+    """Remove the per-run method wrappers from every cached model."""
+    for model in MODELS.values():
+        for path, name in PATCHED_METHODS:
+            vars(operator.attrgetter(path)(model)).pop(name, None)
+
+
+def run(request):
+    """Run one script invocation and return its result dict."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    returncode = 0
+    sys.argv = [request["script"], *request["args"]]
+    sys.stdin = io.StringIO(request.get("stdin", ""))
+    os.chdir(request["cwd"])
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            runpy.run_path(os.path.join(PROJECT_ROOT, request["script"]), run_name="__main__")
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            returncode = e.code or 0
+        else:
+            # sys.exit("message"): the interpreter prints it and exits 1
+            stderr.write(f"{e.code}\n")
+            returncode = 1
+    except Exception as e:
+        stderr.write(f"{type(e).__name__}: {e}\n")
+        returncode = 1
+    finally:
+        restore_model_methods()
+    return {"returncode": returncode, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def main():
+    # Replies go out on a private copy of stdout; anything native code
+    # prints to fd 1 is sent to stderr instead of corrupting the protocol
+    replies = os.fdopen(os.dup(1), "w")
+    os.dup2(2, 1)
+    requests = sys.stdin
+
+    cache_model_loads()
+    for line in requests:
+        replies.write(json.dumps(run(json.loads(line))) + "\n")
+        replies.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,266 @@
 # frozen_string_literal: true
 """Shared pytest fixtures for audio-recordings tests."""
 
+import ast
+import json
 import os
-import shutil
-import tempfile
-import pytest
+import re
+import subprocess
+import wave
+from pathlib import Path
 import numpy as np
+import pytest
 import soundfile as sf
+from pydub import AudioSegment
+
+from fixtures.generate_tone import write_tone_file
+from helpers import CHATTERBOX_PYTHON, PROJECT_ROOT, RECORD_NEEDLES, SPEAK_NEEDLES, TONE_528HZ_PATH
+
+
+def pytest_sessionstart(session):
+    """Render the 528Hz tone if the fixture file is missing."""
+    if not os.path.exists(TONE_528HZ_PATH):
+        write_tone_file(TONE_528HZ_PATH)
+
+
+def pytest_collection_modifyitems(items):
+    """Send every serial test to one xdist worker (needs --dist loadgroup)."""
+    for item in items:
+        if item.get_closest_marker("serial"):
+            item.add_marker(pytest.mark.xdist_group("serial"))
 
 
-FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
-TONE_528HZ_PATH = os.path.join(FIXTURES_DIR, "tone_528hz.wav")
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+@pytest.fixture(scope="session")
+def tone_528hz_samples():
+    """The 528Hz test tone decoded once per session, as (float32 samples, rate)."""
+    return sf.read(TONE_528HZ_PATH, dtype="float32")
 
 
-@pytest.fixture(scope="session", autouse=True)
-def ensure_voice_reference():
-    """Ensure voice_reference.wav exists for integration tests using the test tone."""
+@pytest.fixture(scope="session")
+def ensure_voice_reference(tone_528hz_samples):
+    """Ensure voice_reference.wav exists for integration tests using the test tone.
+
+    Written rather than hardlinked: running ./prepare.py in the project root
+    would otherwise overwrite the shared tone fixture.
+    """
     voice_ref_path = os.path.join(PROJECT_ROOT, "voice_reference.wav")
     if not os.path.exists(voice_ref_path):
-        shutil.copy(TONE_528HZ_PATH, voice_ref_path)
+        sf.write(voice_ref_path, *tone_528hz_samples)
     yield
 
 
+@pytest.fixture(scope="session")
+def chatterbox_runner():
+    """Run Chatterbox scripts in one long-lived venv-chatterbox interpreter.
+
+    Returns run(script, *args, cwd=PROJECT_ROOT, stdin="") giving a
+    CompletedProcess; the model is loaded once for the whole session.
+    """
+    proc = subprocess.Popen(
+        [CHATTERBOX_PYTHON, "-u", os.path.join(os.path.dirname(__file__), "chatterbox_runner.py")],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+    def run(script, *args, cwd=PROJECT_ROOT, stdin=""):
+        request = {"script": script, "args": list(args), "cwd": cwd, "stdin": stdin}
+        proc.stdin.write(json.dumps(request) + "\n")
+        proc.stdin.flush()
+        reply = proc.stdout.readline()
+        if not reply:
+            raise RuntimeError(f"chatterbox_runner exited with code {proc.wait()}")
+        result = json.loads(reply)
+        return subprocess.CompletedProcess(
+            [script, *args], result["returncode"], result["stdout"], result["stderr"]
+        )
+
+    yield run
+    proc.stdin.close()
+    proc.wait()
+
+
+@pytest.fixture(scope="session")
+def _tone_bytes():
+    """Raw bytes of the 528Hz test tone, read once per session."""
+    return Path(TONE_528HZ_PATH).read_bytes()
+
+
+def link_tone(dest, tone_bytes):
+    """Hardlink the test tone to dest, writing the cached bytes across devices.
+
+    Only use this for inputs that tests read; a script writing to a hardlinked
+    path would overwrite the shared fixture.
+    """
+    try:
+        Path(dest).hardlink_to(TONE_528HZ_PATH)
+    except FileExistsError:
+        # Already placed by another fixture; never write through a link
+        pass
+    except OSError:
+        Path(dest).write_bytes(tone_bytes)
+
+
+@pytest.fixture(scope="session")
+def generate_script_path():
+    """Path to generate_positive_audio_clips.py."""
+    return os.path.join(PROJECT_ROOT, "generate_positive_audio_clips.py")
+
+
+@pytest.fixture(scope="session")
+def prepare_script_path():
+    """Path to prepare.py."""
+    return os.path.join(PROJECT_ROOT, "prepare.py")
+
+
+@pytest.fixture(scope="session")
+def record_script_path():
+    """Path to record.py."""
+    return os.path.join(PROJECT_ROOT, "record.py")
+
+
+@pytest.fixture(scope="session")
+def speak_script_path():
+    """Path to speak.py."""
+    return os.path.join(PROJECT_ROOT, "speak.py")
+
+
+def _read_project_file(name):
+    return Path(PROJECT_ROOT, name).read_text()
+
+
+@pytest.fixture(scope="session")
+def generate_script_content():
+    """Source of generate_positive_audio_clips.py, read once per session."""
+    return _read_project_file("generate_positive_audio_clips.py")
+
+
+@pytest.fixture(scope="session")
+def generate_script_ast(generate_script_content):
+    """Parsed AST of generate_positive_audio_clips.py."""
+    return ast.parse(generate_script_content)
+
+
+@pytest.fixture(scope="session")
+def generate_script_constants(generate_script_ast):
+    """Module-level NAME = <literal> assignments in generate_positive_audio_clips.py."""
+    constants = {}
+    for node in generate_script_ast.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        try:
+            value = ast.literal_eval(node.value)
+        except ValueError:
+            continue
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                constants[target.id] = value
+    return constants
+
+
+@pytest.fixture(scope="session")
+def generate_script_arguments(generate_script_ast):
+    """Map each add_argument() name or flag to that call's literal keyword arguments."""
+    arguments = {}
+    for node in ast.walk(generate_script_ast):
+        if not (isinstance(node, ast.Call) and getattr(node.func, "attr", None) == "add_argument"):
+            continue
+        kwargs = {}
+        for keyword in node.keywords:
+            try:
+                kwargs[keyword.arg] = ast.literal_eval(keyword.value)
+            except ValueError:
+                pass
+        for arg in node.args:
+            if isinstance(arg, ast.Constant):
+                arguments[arg.value] = kwargs
+    return arguments
+
+
+@pytest.fixture(scope="session")
+def record_script_content():
+    """Source of record.py, read once per session."""
+    return _read_project_file("record.py")
+
+
+def find_needles(content, needles):
+    """Return the subset of needles occurring in content, found in one regex pass.
+
+    The lookahead lets matches overlap; a needle that is a prefix of another
+    one at the same position is shadowed, so keep needle lists prefix-free.
+    """
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, needles)) + "))")
+    return frozenset(pattern.findall(content))
+
+
+@pytest.fixture(scope="session")
+def record_needles_present(record_script_content):
+    """Which of RECORD_NEEDLES occur in record.py."""
+    return find_needles(record_script_content, RECORD_NEEDLES)
+
+
+@pytest.fixture(scope="session")
+def record_script_content_lower(record_script_content):
+    """Lowercased source of record.py for case-insensitive checks."""
+    return record_script_content.lower()
+
+
+@pytest.fixture(scope="session")
+def record_script_facts(record_script_content):
+    """Top-level imports, function names and the PARAGRAPHS tuple of record.py.
+
+    Parsed rather than imported: importing record.py needs sounddevice and
+    an audio device.
+    """
+    tree = ast.parse(record_script_content)
+    imports = set()
+    defs = set()
+    paragraphs = ()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            imports.add(node.module)
+        elif isinstance(node, ast.FunctionDef):
+            defs.add(node.name)
+        elif isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "PARAGRAPHS" for target in node.targets
+        ):
+            paragraphs = ast.literal_eval(node.value)
+    return {"imports": imports, "defs": defs, "paragraphs": paragraphs}
+
+
+@pytest.fixture(scope="session")
+def record_paragraphs(record_script_facts):
+    """The PARAGRAPHS tuple from record.py."""
+    return record_script_facts["paragraphs"]
+
+
+@pytest.fixture(scope="session")
+def speak_script_content():
+    """Source of speak.py, read once per session."""
+    return _read_project_file("speak.py")
+
+
+@pytest.fixture(scope="session")
+def speak_needles_present(speak_script_content):
+    """Which of SPEAK_NEEDLES occur in speak.py."""
+    return find_needles(speak_script_content, SPEAK_NEEDLES)
+
+
+@pytest.fixture(scope="session")
+def install_script_content():
+    """Source of install.sh, read once per session."""
+    return _read_project_file("install.sh")
+
+
+@pytest.fixture(scope="session")
+def prepare_mod():
+    """The prepare module, imported once per session."""
+    import prepare
+    return prepare
+
+
 @pytest.fixture
 def tone_528hz_path():
     """Return path to the 528Hz test tone file."""
@@ -35,76 +273,149 @@ def project_root():
     return PROJECT_ROOT
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory that is cleaned up after the test."""
-    tmpdir = tempfile.mkdtemp()
-    yield tmpdir
-    shutil.rmtree(tmpdir, ignore_errors=True)
+@pytest.fixture(scope="session")
+def tone_528hz_clip():
+    """The 528Hz test tone decoded once as an AudioSegment (immutable, so shared)."""
+    return AudioSegment.from_file(TONE_528HZ_PATH)
+
+
+@pytest.fixture(scope="session")
+def pcm_clip():
+    """Return a builder for small mono 16-bit AudioSegments from sample values.
+
+    The default 1kHz rate makes one frame one millisecond, so placement
+    offsets map straight onto sample indices.
+    """
+    def _build(samples, frame_rate=1000):
+        data = np.asarray(samples, dtype=np.int16).tobytes()
+        return AudioSegment(data, frame_rate=frame_rate, sample_width=2, channels=1)
+    return _build
+
+
+@pytest.fixture(scope="session")
+def tone_528hz_stereo_clip(tone_528hz_clip):
+    """The 528Hz test tone duplicated into both channels."""
+    return AudioSegment.from_mono_audiosegments(tone_528hz_clip, tone_528hz_clip)
 
 
 @pytest.fixture
-def temp_working_dir(temp_dir):
-    """Create a temporary working directory with the expected structure."""
-    voice_samples_dir = os.path.join(temp_dir, "voice_samples")
-    spoken_affirmations_dir = os.path.join(temp_dir, "spoken_affirmations")
+def temp_dir(tmp_path):
+    """Return a temporary directory; pytest handles cleanup."""
+    return str(tmp_path)
+
+
+def make_working_dir(root):
+    """Create the voice_samples/ and spoken_affirmations/ layout under root."""
+    voice_samples_dir = os.path.join(root, "voice_samples")
+    spoken_affirmations_dir = os.path.join(root, "spoken_affirmations")
     os.makedirs(voice_samples_dir)
     os.makedirs(spoken_affirmations_dir)
 
     return {
-        "root": temp_dir,
+        "root": root,
         "voice_samples": voice_samples_dir,
         "spoken_affirmations": spoken_affirmations_dir,
     }
 
 
 @pytest.fixture
-def sample_recording(temp_working_dir):
-    """Create a sample recording file in voice_samples/."""
-    recording_path = os.path.join(
-        temp_working_dir["voice_samples"],
-        "recording_20240101_120000.wav"
-    )
-    shutil.copy(TONE_528HZ_PATH, recording_path)
-    return recording_path
+def temp_working_dir(temp_dir):
+    """Create a temporary working directory with the expected structure."""
+    return make_working_dir(temp_dir)
 
 
 @pytest.fixture
-def multiple_recordings(temp_working_dir):
-    """Create multiple recording files in voice_samples/."""
-    paths = []
-    for i in range(3):
+def in_working_dir(temp_working_dir, monkeypatch):
+    """Run the test from inside temp_working_dir; the cwd is restored afterwards."""
+    monkeypatch.chdir(temp_working_dir["root"])
+    return temp_working_dir["root"]
+
+
+@pytest.fixture(scope="module")
+def shared_working_dir(tmp_path_factory):
+    """Working directory shared by a module's tests; don't modify its contents."""
+    return make_working_dir(str(tmp_path_factory.mktemp("work")))
+
+
+@pytest.fixture
+def make_recording(temp_working_dir, _tone_bytes):
+    """Factory fixture creating recording files in voice_samples/ on demand."""
+    def _make(i=0):
         recording_path = os.path.join(
             temp_working_dir["voice_samples"],
             f"recording_2024010{i+1}_120000.wav"
         )
-        shutil.copy(TONE_528HZ_PATH, recording_path)
-        paths.append(recording_path)
-    return paths
+        link_tone(recording_path, _tone_bytes)
+        return recording_path
+    return _make
 
 
 @pytest.fixture
-def voice_reference(temp_working_dir):
-    """Create a voice reference file in the temp directory."""
-    ref_path = os.path.join(temp_working_dir["root"], "voice_reference.wav")
-    shutil.copy(TONE_528HZ_PATH, ref_path)
-    return ref_path
+def sample_recording(make_recording):
+    """Create a sample recording file in voice_samples/."""
+    return make_recording()
 
 
 @pytest.fixture
-def sample_affirmation_clips(temp_working_dir):
-    """Create sample affirmation clips in spoken_affirmations/."""
+def multiple_recordings(make_recording):
+    """Create multiple recording files in voice_samples/."""
+    return [make_recording(i) for i in range(3)]
+
+
+@pytest.fixture(scope="session")
+def recording_duration_ms():
+    """Length in ms of each test recording, read from the WAV header once."""
+    with wave.open(TONE_528HZ_PATH) as w:
+        return w.getnframes() / w.getframerate() * 1000
+
+
+@pytest.fixture(scope="session")
+def read_wav_samples():
+    """Return a reader giving (int16 samples shaped (frames, channels), rate) for a WAV.
+
+    Uses the wave module directly, so no ffmpeg is spawned for the decode.
+    """
+    def _read(path):
+        with wave.open(path) as w:
+            samples = np.frombuffer(w.readframes(w.getnframes()), dtype=np.int16)
+            return samples.reshape(-1, w.getnchannels()), w.getframerate()
+    return _read
+
+
+def affirmation_clip_path(working_dir, i):
+    """Path of the i-th test affirmation clip in working_dir's spoken_affirmations/."""
+    return os.path.join(
+        working_dir["spoken_affirmations"],
+        f"{i+1:02d}_test_affirmation_{i+1}.wav"
+    )
+
+
+def make_affirmation_clips(working_dir, tone_bytes):
+    """Create five affirmation clips in working_dir's spoken_affirmations/."""
     paths = []
     for i in range(5):
-        clip_path = os.path.join(
-            temp_working_dir["spoken_affirmations"],
-            f"{i+1:02d}_test_affirmation_{i+1}.wav"
-        )
-        shutil.copy(TONE_528HZ_PATH, clip_path)
+        clip_path = affirmation_clip_path(working_dir, i)
+        link_tone(clip_path, tone_bytes)
         paths.append(clip_path)
     return paths
 
 
+@pytest.fixture(scope="module")
+def shared_affirmation_clips(shared_working_dir, _tone_bytes):
+    """Affirmation clips created once per module, for tests that only read them."""
+    return make_affirmation_clips(shared_working_dir, _tone_bytes)
+
+
+@pytest.fixture(scope="module")
+def seeded_weave_output(shared_working_dir, shared_affirmation_clips):
+    """Path of one weave_stereo(seed=42) render of the shared clips, made once per module."""
+    from weave import weave_stereo
+
+    output_path = os.path.join(shared_working_dir["root"], "seeded_output.wav")
+    weave_stereo(clip_paths=shared_affirmation_clips, output_path=output_path, seed=42)
+    return output_path
+
+
 @pytest.fixture
 def messages_file(temp_working_dir):
     """Create a positive_messages.txt file."""
@@ -115,31 +426,5 @@ def messages_file(temp_working_dir):
         "I am strong and capable.",
         "I deserve happiness.",
     ]
-    with open(messages_path, "w") as f:
-        f.write("\n".join(messages))
+    Path(messages_path).write_text("\n".join(messages))
     return messages_path
-
-
-def generate_tone(frequency, duration, sample_rate=44100):
-    """Generate a sine wave tone."""
-    t = np.linspace(0, duration, int(sample_rate * duration), dtype=np.float32)
-    tone = np.sin(2 * np.pi * frequency * t)
-
-    fade_samples = int(0.01 * sample_rate)
-    fade_in = np.linspace(0, 1, fade_samples)
-    fade_out = np.linspace(1, 0, fade_samples)
-    tone[:fade_samples] *= fade_in
-    tone[-fade_samples:] *= fade_out
-
-    return tone.astype(np.float32)
-
-
-@pytest.fixture
-def generate_test_wav(temp_dir):
-    """Factory fixture to generate test WAV files."""
-    def _generate(filename, duration=1.0, frequency=440):
-        path = os.path.join(temp_dir, filename)
-        tone = generate_tone(frequency, duration)
-        sf.write(path, tone, 44100)
-        return path
-    return _generate
@@ -10,26 +10,36 @@ DURATION_SEC = 1.0
 FREQUENCY_HZ = 528
 
 
-def generate_tone(frequency, duration, sample_rate):
+def generate_tone(frequency, duration, sample_rate=SAMPLE_RATE):
     """Generate a sine wave tone."""
-    t = np.linspace(0, duration, int(sample_rate * duration), dtype=np.float32)
-    # Apply fade in/out to avoid clicks
-    tone = np.sin(2 * np.pi * frequency * t)
+    # Sample k sits at k / sample_rate; compute the phase and sine in place,
+    # staying in float32
+    phase = np.arange(int(sample_rate * duration), dtype=np.float32)
+    phase *= 2 * np.pi * frequency / sample_rate
+    tone = np.sin(phase, out=phase)
 
-    # Apply 10ms fade in/out
+    # Apply 10ms fade in/out; the fade-out is a reversed view of the same ramp
     fade_samples = int(0.01 * sample_rate)
-    fade_in = np.linspace(0, 1, fade_samples)
-    fade_out = np.linspace(1, 0, fade_samples)
-    tone[:fade_samples] *= fade_in
-    tone[-fade_samples:] *= fade_out
+    ramp = np.linspace(0, 1, fade_samples, dtype=np.float32)
+    tone[:fade_samples] *= ramp
+    tone[-fade_samples:] *= ramp[::-1]
 
-    return tone.astype(np.float32)
+    return tone
+
+
+def write_tone_file(output_path):
+    """Render the 528Hz fixture tone to output_path."""
+    tone = generate_tone(FREQUENCY_HZ, DURATION_SEC, SAMPLE_RATE)
+    # Write beside the target and rename, so concurrent sessions never see
+    # a half-written file
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    sf.write(tmp_path, tone, SAMPLE_RATE, format="WAV", subtype="PCM_16")
+    os.replace(tmp_path, output_path)
 
 
 if __name__ == "__main__":
     script_dir = os.path.dirname(os.path.abspath(__file__))
     output_path = os.path.join(script_dir, "tone_528hz.wav")
 
-    tone = generate_tone(FREQUENCY_HZ, DURATION_SEC, SAMPLE_RATE)
-    sf.write(output_path, tone, SAMPLE_RATE)
+    write_tone_file(output_path)
     print(f"Generated: {output_path} ({DURATION_SEC}s @ {FREQUENCY_HZ}Hz)")
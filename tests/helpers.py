@@ -0,0 +1,43 @@
+# frozen_string_literal: true
+"""Constants shared by conftest.py and the test modules.
+
+Test modules import from here rather than from conftest: under
+--import-mode=importlib pytest loads conftest under its own module name, so a
+plain "import conftest" would load a second copy.
+"""
+
+import os
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+TONE_528HZ_PATH = os.path.join(FIXTURES_DIR, "tone_528hz.wav")
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CHATTERBOX_PYTHON = os.path.join(PROJECT_ROOT, "venv-chatterbox", "bin", "python3")
+HAS_CHATTERBOX_VENV = os.path.exists(CHATTERBOX_PYTHON)
+HAS_VENV = os.path.exists(os.path.join(PROJECT_ROOT, "venv"))
+
+# Substrings the content tests look for, each script scanned once per session
+RECORD_NEEDLES = (
+    '"""',
+    "SAMPLE_RATE = 44100",
+    "CHANNELS = 1",
+    "PARAGRAPHS = (",
+    "voice_samples/",
+    "recording_",
+    "strftime",
+    "signal.SIGINT",
+    "stop_recording",
+    "argparse",
+)
+SPEAK_NEEDLES = (
+    '"""',
+    'REFERENCE_FILE = "voice_reference.wav"',
+    'OUTPUT_DIR = "spoken_affirmations"',
+    'add_argument("text"',
+    '"-o"',
+    '"--output"',
+    '"-e"',
+    '"--exaggeration"',
+    '"--no-play"',
+    "default=0.5",
+)
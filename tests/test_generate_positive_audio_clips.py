@@ -1,162 +1,94 @@
 # frozen_string_literal: true
 """Tests for generate_positive_audio_clips.py batch TTS generation script."""
 
+import argparse
+import io
 import os
+import stat
 import sys
 import subprocess
 import pytest
 
-from conftest import PROJECT_ROOT
+from helpers import CHATTERBOX_PYTHON, HAS_CHATTERBOX_VENV
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# torch and chatterbox are imported lazily inside main(), so this is cheap
+from generate_positive_audio_clips import (
+    STOCK_MESSAGES,
+    get_messages,
+    load_messages_from_file,
+    sanitize_filename,
+)
 
 
 class TestGenerateScriptBasics:
     """Basic tests for generate_positive_audio_clips.py."""
 
-    def test_script_exists(self, project_root):
-        """Verify script exists."""
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-
-        assert os.path.exists(script_path)
+    def test_script_is_executable_file(self, generate_script_path):
+        """Verify script exists as a regular file with execute permission."""
+        st = os.stat(generate_script_path)
 
-    def test_script_is_executable(self, project_root):
-        """Verify script is executable."""
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
+        assert stat.S_ISREG(st.st_mode)
+        assert st.st_mode & 0o111
 
-        assert os.access(script_path, os.X_OK)
-
-    def test_script_has_docstring(self, project_root):
+    def test_script_has_docstring(self, generate_script_content):
         """Verify script has a docstring."""
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-
-        with open(script_path, "r") as f:
-            content = f.read()
-
-        assert '"""' in content
+        assert '"""' in generate_script_content
 
 
 class TestGenerateConstants:
     """Tests for generate_positive_audio_clips.py constants."""
 
-    def test_reference_file_in_script(self, project_root):
+    def test_reference_file_in_script(self, generate_script_constants):
         """Test REFERENCE_FILE constant is set."""
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-
-        with open(script_path, "r") as f:
-            content = f.read()
+        assert generate_script_constants["REFERENCE_FILE"] == "voice_reference.wav"
 
-        assert 'REFERENCE_FILE = "voice_reference.wav"' in content
-
-    def test_output_dir_in_script(self, project_root):
+    def test_output_dir_in_script(self, generate_script_constants):
         """Test DEFAULT_OUTPUT_DIR constant is set."""
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-
-        with open(script_path, "r") as f:
-            content = f.read()
+        assert generate_script_constants["DEFAULT_OUTPUT_DIR"] == "spoken_affirmations"
 
-        assert 'DEFAULT_OUTPUT_DIR = "spoken_affirmations"' in content
-
-    def test_messages_file_in_script(self, project_root):
+    def test_messages_file_in_script(self, generate_script_constants):
         """Test MESSAGES_FILE constant is set."""
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-
-        with open(script_path, "r") as f:
-            content = f.read()
+        assert generate_script_constants["MESSAGES_FILE"] == "positive_messages.txt"
 
-        assert 'MESSAGES_FILE = "positive_messages.txt"' in content
-
-    def test_default_sample_count_in_script(self, project_root):
+    def test_default_sample_count_in_script(self, generate_script_constants):
         """Test DEFAULT_SAMPLE_COUNT constant is set."""
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-
-        with open(script_path, "r") as f:
-            content = f.read()
+        assert "DEFAULT_SAMPLE_COUNT" in generate_script_constants
 
-        assert "DEFAULT_SAMPLE_COUNT" in content
-
-    def test_has_stock_messages(self, project_root):
+    def test_has_stock_messages(self, generate_script_constants):
         """Test STOCK_MESSAGES list exists."""
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-
-        with open(script_path, "r") as f:
-            content = f.read()
+        stock_messages = generate_script_constants["STOCK_MESSAGES"]
 
-        assert "STOCK_MESSAGES" in content
-        assert "I am worthy" in content
+        assert any(msg.startswith("I am worthy") for msg in stock_messages)
 
 
 class TestGenerateArgparse:
     """Tests for generate_positive_audio_clips.py argument parsing."""
 
-    def test_has_messages_argument(self, project_root):
+    def test_has_messages_argument(self, generate_script_arguments):
         """Test that messages argument is defined."""
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-
-        with open(script_path, "r") as f:
-            content = f.read()
-
-        assert '"messages"' in content
-        assert 'nargs="*"' in content
+        assert generate_script_arguments["messages"]["nargs"] == "*"
 
-    def test_has_count_flag(self, project_root):
+    def test_has_count_flag(self, generate_script_arguments):
         """Test that -n/--count flag is defined."""
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
+        assert "-n" in generate_script_arguments
+        assert "--count" in generate_script_arguments
 
-        with open(script_path, "r") as f:
-            content = f.read()
-
-        assert '"-n"' in content
-        assert '"--count"' in content
-
-    def test_has_output_dir_flag(self, project_root):
+    def test_has_output_dir_flag(self, generate_script_arguments):
         """Test that -o/--output-dir flag is defined."""
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-
-        with open(script_path, "r") as f:
-            content = f.read()
-
-        assert '"-o"' in content
-        assert '"--output-dir"' in content
+        assert "-o" in generate_script_arguments
+        assert "--output-dir" in generate_script_arguments
 
-    def test_has_exaggeration_flag(self, project_root):
+    def test_has_exaggeration_flag(self, generate_script_arguments):
         """Test that -e/--exaggeration flag is defined."""
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-
-        with open(script_path, "r") as f:
-            content = f.read()
-
-        assert '"-e"' in content
-        assert '"--exaggeration"' in content
+        assert "-e" in generate_script_arguments
+        assert "--exaggeration" in generate_script_arguments
 
 
 class TestSanitizeFilename:
-    """Tests for sanitize_filename function (import-safe)."""
+    """Tests for sanitize_filename function."""
 
     def test_removes_special_characters(self):
         """Test that special characters are removed."""
-        # Import only what we need without triggering torch import
-        import importlib.util
-        import os
-
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-
-        with open(script_path, "r") as f:
-            content = f.read()
-
-        # Extract and execute just the sanitize_filename function
-        exec_globals = {}
-        function_code = '''
-def sanitize_filename(text, max_len=40):
-    """Convert text to a safe filename."""
-    safe = "".join(c if c.isalnum() or c in " -_" else "" for c in text)
-    safe = safe.strip().replace(" ", "_").lower()
-    return safe[:max_len] if len(safe) > max_len else safe
-'''
-        exec(function_code, exec_globals)
-        sanitize_filename = exec_globals['sanitize_filename']
-
         result = sanitize_filename("Hello! How are you?")
 
         assert result == "hello_how_are_you"
@@ -165,17 +97,6 @@ def sanitize_filename(text, max_len=40):
 
     def test_truncates_long_strings(self):
         """Test that long strings are truncated."""
-        exec_globals = {}
-        function_code = '''
-def sanitize_filename(text, max_len=40):
-    """Convert text to a safe filename."""
-    safe = "".join(c if c.isalnum() or c in " -_" else "" for c in text)
-    safe = safe.strip().replace(" ", "_").lower()
-    return safe[:max_len] if len(safe) > max_len else safe
-'''
-        exec(function_code, exec_globals)
-        sanitize_filename = exec_globals['sanitize_filename']
-
         long_text = "This is a very long text that should be truncated to fit the filename limit"
         result = sanitize_filename(long_text)
 
@@ -183,34 +104,12 @@ def sanitize_filename(text, max_len=40):
 
     def test_converts_to_lowercase(self):
         """Test that text is converted to lowercase."""
-        exec_globals = {}
-        function_code = '''
-def sanitize_filename(text, max_len=40):
-    """Convert text to a safe filename."""
-    safe = "".join(c if c.isalnum() or c in " -_" else "" for c in text)
-    safe = safe.strip().replace(" ", "_").lower()
-    return safe[:max_len] if len(safe) > max_len else safe
-'''
-        exec(function_code, exec_globals)
-        sanitize_filename = exec_globals['sanitize_filename']
-
         result = sanitize_filename("HELLO World")
 
         assert result == "hello_world"
 
     def test_replaces_spaces_with_underscores(self):
         """Test that spaces are replaced with underscores."""
-        exec_globals = {}
-        function_code = '''
-def sanitize_filename(text, max_len=40):
-    """Convert text to a safe filename."""
-    safe = "".join(c if c.isalnum() or c in " -_" else "" for c in text)
-    safe = safe.strip().replace(" ", "_").lower()
-    return safe[:max_len] if len(safe) > max_len else safe
-'''
-        exec(function_code, exec_globals)
-        sanitize_filename = exec_globals['sanitize_filename']
-
         result = sanitize_filename("hello world")
 
         assert result == "hello_world"
@@ -228,21 +127,6 @@ class TestLoadMessagesFromFile:
             f.write("Message two\n")
             f.write("Message three\n")
 
-        exec_globals = {}
-        function_code = '''
-def load_messages_from_file(filepath):
-    """Load messages from a text file, one per line."""
-    messages = []
-    with open(filepath, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                messages.append(line)
-    return messages
-'''
-        exec(function_code, exec_globals)
-        load_messages_from_file = exec_globals['load_messages_from_file']
-
         result = load_messages_from_file(messages_path)
 
         assert len(result) == 3
@@ -259,21 +143,6 @@ def load_messages_from_file(filepath):
             f.write("# Another comment\n")
             f.write("Message two\n")
 
-        exec_globals = {}
-        function_code = '''
-def load_messages_from_file(filepath):
-    """Load messages from a text file, one per line."""
-    messages = []
-    with open(filepath, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                messages.append(line)
-    return messages
-'''
-        exec(function_code, exec_globals)
-        load_messages_from_file = exec_globals['load_messages_from_file']
-
         result = load_messages_from_file(messages_path)
 
         assert len(result) == 2
@@ -288,21 +157,6 @@ def load_messages_from_file(filepath):
             f.write("   \n")
             f.write("Message two\n")
 
-        exec_globals = {}
-        function_code = '''
-def load_messages_from_file(filepath):
-    """Load messages from a text file, one per line."""
-    messages = []
-    with open(filepath, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                messages.append(line)
-    return messages
-'''
-        exec(function_code, exec_globals)
-        load_messages_from_file = exec_globals['load_messages_from_file']
-
         result = load_messages_from_file(messages_path)
 
         assert len(result) == 2
@@ -311,17 +165,11 @@ def load_messages_from_file(filepath):
 class TestGenerateCLI:
     """Tests for generate_positive_audio_clips.py command-line interface."""
 
-    @pytest.mark.skipif(
-        not os.path.exists(os.path.join(PROJECT_ROOT, "venv-chatterbox")),
-        reason="venv-chatterbox not set up"
-    )
-    def test_help_flag(self, project_root):
+    @pytest.mark.skipif(not HAS_CHATTERBOX_VENV, reason="venv-chatterbox not set up")
+    def test_help_flag(self, generate_script_path):
         """Test --help flag."""
-        venv_python = os.path.join(project_root, "venv-chatterbox", "bin", "python3")
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-
         result = subprocess.run(
-            [venv_python, script_path, "--help"],
+            [CHATTERBOX_PYTHON, generate_script_path, "--help"],
             capture_output=True,
             text=True
         )
@@ -334,17 +182,11 @@ class TestGenerateCLI:
         assert "-e" in result.stdout
         assert "--exaggeration" in result.stdout
 
-    @pytest.mark.skipif(
-        not os.path.exists(os.path.join(PROJECT_ROOT, "venv-chatterbox")),
-        reason="venv-chatterbox not set up"
-    )
-    def test_fails_without_reference_file(self, project_root, temp_dir):
+    @pytest.mark.skipif(not HAS_CHATTERBOX_VENV, reason="venv-chatterbox not set up")
+    def test_fails_without_reference_file(self, generate_script_path, temp_dir):
         """Test that script fails when voice_reference.wav is missing."""
-        venv_python = os.path.join(project_root, "venv-chatterbox", "bin", "python3")
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-
         result = subprocess.run(
-            [venv_python, script_path, "Hello world"],
+            [CHATTERBOX_PYTHON, generate_script_path, "Hello world"],
             capture_output=True,
             text=True,
             cwd=temp_dir,
@@ -353,97 +195,64 @@ class TestGenerateCLI:
 
         assert result.returncode != 0 or "voice_reference.wav" in result.stdout
 
+    def test_concat_with_no_messages_exits_cleanly(self, generate_script_path, temp_dir):
+        """Test that --concat with nothing to generate exits 0 without creating files."""
+        # Exits before torch is imported, so the project interpreter is enough
+        result = subprocess.run(
+            [sys.executable, generate_script_path, "Hello world", "-n", "0",
+             "--concat", "all.wav", "-o", "output"],
+            capture_output=True,
+            text=True,
+            cwd=temp_dir
+        )
+
+        assert result.returncode == 0
+        assert "No messages to generate" in result.stdout
+        assert os.listdir(temp_dir) == []
+
 
+@pytest.mark.serial
 class TestGenerateIntegration:
     """Integration tests for generate_positive_audio_clips.py."""
 
     @pytest.mark.slow
-    @pytest.mark.skipif(
-        not os.path.exists(os.path.join(PROJECT_ROOT, "venv-chatterbox")),
-        reason="venv-chatterbox not set up"
-    )
-    def test_generates_audio_with_positional_messages(self, project_root, temp_dir, ensure_voice_reference):
+    @pytest.mark.skipif(not HAS_CHATTERBOX_VENV, reason="venv-chatterbox not set up")
+    def test_generates_audio_with_positional_messages(self, chatterbox_runner, project_root, tmp_path, ensure_voice_reference):
         """Test generating audio with positional message arguments."""
-        venv_python = os.path.join(project_root, "venv-chatterbox", "bin", "python3")
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-        output_dir = os.path.join(temp_dir, "output")
+        output_dir = tmp_path / "output"
 
-        result = subprocess.run(
-            [
-                venv_python, script_path,
-                "Test message one", "Test message two",
-                "-o", output_dir
-            ],
-            capture_output=True,
-            text=True,
+        result = chatterbox_runner(
+            "generate_positive_audio_clips.py",
+            "Test message one", "Test message two",
+            "-o", str(output_dir),
             cwd=project_root
         )
 
         assert result.returncode == 0
-        assert os.path.isdir(output_dir)
-
-        wav_files = [f for f in os.listdir(output_dir) if f.endswith(".wav")]
-        assert len(wav_files) == 2
+        assert output_dir.is_dir()
+        assert len(list(output_dir.glob("*.wav"))) == 2
 
     @pytest.mark.slow
-    @pytest.mark.skipif(
-        not os.path.exists(os.path.join(PROJECT_ROOT, "venv-chatterbox")),
-        reason="venv-chatterbox not set up"
-    )
-    def test_count_flag_limits_messages(self, project_root, temp_dir, messages_file, ensure_voice_reference):
+    @pytest.mark.skipif(not HAS_CHATTERBOX_VENV, reason="venv-chatterbox not set up")
+    def test_count_flag_limits_messages(self, chatterbox_runner, tmp_path, messages_file, ensure_voice_reference):
         """Test that -n flag limits number of messages."""
-        venv_python = os.path.join(project_root, "venv-chatterbox", "bin", "python3")
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-        output_dir = os.path.join(temp_dir, "output")
+        output_dir = tmp_path / "output"
 
-        result = subprocess.run(
-            [
-                venv_python, script_path,
-                "-n", "2",
-                "-o", output_dir
-            ],
-            capture_output=True,
-            text=True,
+        result = chatterbox_runner(
+            "generate_positive_audio_clips.py",
+            "-n", "2",
+            "-o", str(output_dir),
             cwd=os.path.dirname(messages_file)
         )
 
         if result.returncode == 0:
-            wav_files = [f for f in os.listdir(output_dir) if f.endswith(".wav")]
-            assert len(wav_files) == 2
+            assert len(list(output_dir.glob("*.wav"))) == 2
 
 
 class TestGetMessagesExcludesStockMessages:
     """Tests ensuring get_messages never mixes in stock messages when a source is provided."""
 
-    def get_stock_messages_from_script(self, project_root):
-        """Extract STOCK_MESSAGES from the actual script."""
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-        with open(script_path, "r") as f:
-            content = f.read()
-
-        exec_globals = {}
-        import re
-        match = re.search(r'(STOCK_MESSAGES\s*=\s*\[.*?\])', content, re.DOTALL)
-        if match:
-            exec(match.group(1), exec_globals)
-            return exec_globals.get('STOCK_MESSAGES', [])
-        return []
-
-    def extract_get_messages_function(self, project_root):
-        """Extract the get_messages function code from the actual script."""
-        script_path = os.path.join(project_root, "generate_positive_audio_clips.py")
-        with open(script_path, "r") as f:
-            content = f.read()
-
-        import re
-        match = re.search(
-            r'(def get_messages\(args\):.*?)(?=\ndef \w|\nclass \w|\nif __name__|$)',
-            content,
-            re.DOTALL
-        )
-        return match.group(1) if match else ""
-
-    def test_file_messages_excludes_stock_when_file_exists(self, project_root, temp_dir, monkeypatch):
+    def test_file_messages_excludes_stock_when_file_exists(self, temp_dir, monkeypatch):
         """When positive_messages.txt exists, only its messages are returned - no stock messages."""
         custom_messages = [
             "This is my unique custom message one.",
@@ -456,115 +265,26 @@ class TestGetMessagesExcludesStockMessages:
                 f.write(msg + "\n")
 
         monkeypatch.chdir(temp_dir)
+        monkeypatch.setattr(sys, "stdin", type("FakeStdin", (), {"isatty": lambda self: True})())
 
-        STOCK_MESSAGES = self.get_stock_messages_from_script(project_root)
-        get_messages_code = self.extract_get_messages_function(project_root)
-
-        exec_globals = {'os': os, 'sys': sys, 'STOCK_MESSAGES': STOCK_MESSAGES}
-        code_to_exec = '''
-import sys
-import os
-
-MESSAGES_FILE = "positive_messages.txt"
-
-def load_messages_from_file(filepath):
-    messages = []
-    with open(filepath, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                messages.append(line)
-    return messages
-
-def read_from_stdin():
-    messages = []
-    for line in sys.stdin:
-        line = line.strip()
-        if line and not line.startswith('#'):
-            messages.append(line)
-    return messages
-
-class Args:
-    messages = []
-
-''' + get_messages_code
-        exec(code_to_exec, exec_globals)
-        get_messages = exec_globals['get_messages']
-        Args = exec_globals['Args']
-
-        monkeypatch.setattr('sys.stdin', type('FakeStdin', (), {'isatty': lambda self: True})())
-
-        args = Args()
-        result = get_messages(args)
+        result = get_messages(argparse.Namespace(messages=[]))
 
         assert result == custom_messages, f"Expected only custom messages, got: {result}"
 
         for stock_msg in STOCK_MESSAGES:
             assert stock_msg not in result, f"Stock message incorrectly included: {stock_msg}"
 
-    def test_stdin_messages_excludes_stock_when_piped(self, project_root, temp_dir, monkeypatch):
+    def test_stdin_messages_excludes_stock_when_piped(self, temp_dir, monkeypatch):
         """When reading from stdin, only stdin messages are returned - no stock messages."""
-        import io
-
         stdin_messages = [
             "Stdin message one that is unique.",
             "Another stdin-only message here.",
         ]
 
         monkeypatch.chdir(temp_dir)
+        monkeypatch.setattr(sys, "stdin", io.StringIO("\n".join(stdin_messages) + "\n"))
 
-        STOCK_MESSAGES = self.get_stock_messages_from_script(project_root)
-
-        exec_globals = {'os': os, 'sys': sys, 'io': io, 'STOCK_MESSAGES': STOCK_MESSAGES}
-        code_to_exec = '''
-import sys
-import os
-import io
-
-MESSAGES_FILE = "positive_messages.txt"
-
-def load_messages_from_file(filepath):
-    messages = []
-    with open(filepath, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                messages.append(line)
-    return messages
-
-class Args:
-    messages = []
-
-def get_messages_with_stdin(args, stdin_stream):
-    if not stdin_stream.isatty():
-        messages = []
-        for line in stdin_stream:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                messages.append(line)
-        if messages:
-            return messages
-
-    if args.messages:
-        return args.messages
-
-    if os.path.exists(MESSAGES_FILE):
-        messages = load_messages_from_file(MESSAGES_FILE)
-        if not messages:
-            sys.exit(1)
-        return messages
-
-    return STOCK_MESSAGES
-'''
-        exec(code_to_exec, exec_globals)
-        get_messages_with_stdin = exec_globals['get_messages_with_stdin']
-        Args = exec_globals['Args']
-
-        fake_stdin = io.StringIO("\n".join(stdin_messages) + "\n")
-        fake_stdin.isatty = lambda: False
-
-        args = Args()
-        result = get_messages_with_stdin(args, fake_stdin)
+        result = get_messages(argparse.Namespace(messages=[]))
 
         assert result == stdin_messages, f"Expected only stdin messages, got: {result}"
 
@@ -0,0 +1,29 @@
+# frozen_string_literal: true
+"""Tests for the fixtures/generate_tone.py test tone generator."""
+
+import numpy as np
+
+from fixtures.generate_tone import generate_tone
+
+
+class TestGenerateTone:
+    """Tests for generate_tone."""
+
+    def test_returns_float32(self):
+        """Test that the tone is float32 without a trailing astype."""
+        tone = generate_tone(528, 0.1)
+
+        assert tone.dtype == np.float32
+
+    def test_length_matches_duration(self):
+        """Test that the tone has sample_rate * duration samples."""
+        tone = generate_tone(528, 0.5, sample_rate=8000)
+
+        assert len(tone) == 4000
+
+    def test_fades_in_and_out(self):
+        """Test that the tone starts and ends at silence."""
+        tone = generate_tone(528, 0.1)
+
+        assert tone[0] == 0
+        assert abs(tone[-1]) < 1e-3
@@ -2,31 +2,55 @@
 """Tests for weave.py audio weaving script."""
 
 import os
-import sys
-import subprocess
-import shutil
+import stat
 import pytest
-from pydub import AudioSegment
-
-from conftest import PROJECT_ROOT
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pydub import effects
+
+from weave import (
+    CROSSFEED,
+    DURATION_TOLERANCE_MS,
+    FADE_IN_MS,
+    FADE_OUT_MS,
+    MIN_OUTPUT_FRAME_RATE,
+    OUTPUT_PREFIX,
+    OVERLAP_MS,
+    POS_HARD_LEFT,
+    POS_HARD_RIGHT,
+    POS_SOFT_LEFT,
+    POS_SOFT_RIGHT,
+    PROFILE_A,
+    PROFILE_B,
+    RIGHT_CHANNEL_DELAY_MS,
+    WEAVE_INITIAL_CLIPS,
+    WEAVE_INITIAL_DELAY_MS,
+    WEAVE_NORMAL_DELAY_MS,
+    apply_fades,
+    apply_profile,
+    build_clip_pool_for_duration,
+    build_parser,
+    build_standard_weave,
+    change_tempo,
+    estimate_duration,
+    high_pass_filter,
+    low_pass_filter,
+    get_next_output_path,
+    make_mono,
+    mix_stereo,
+    pan_to_stereo,
+    process_clip,
+    weave_stereo,
+)
 
 
 class TestWeaveScriptBasics:
     """Basic tests for weave.py."""
 
-    def test_script_exists(self, project_root):
-        """Verify weave.py exists."""
-        script_path = os.path.join(project_root, "weave.py")
-
-        assert os.path.exists(script_path)
-
-    def test_script_is_executable(self, project_root):
-        """Verify weave.py is executable."""
-        script_path = os.path.join(project_root, "weave.py")
+    def test_script_is_executable_file(self, project_root):
+        """Verify weave.py exists as a regular file with execute permission."""
+        st = os.stat(os.path.join(project_root, "weave.py"))
 
-        assert os.access(script_path, os.X_OK)
+        assert stat.S_ISREG(st.st_mode)
+        assert st.st_mode & 0o111
 
 
 class TestWeaveConstants:
@@ -34,33 +58,23 @@ class TestWeaveConstants:
 
     def test_output_prefix(self):
         """Test OUTPUT_PREFIX constant."""
-        from weave import OUTPUT_PREFIX
-
         assert OUTPUT_PREFIX == "spoken_messages_"
 
     def test_overlap_ms(self):
         """Test OVERLAP_MS is reasonable."""
-        from weave import OVERLAP_MS
-
         assert OVERLAP_MS > 0
         assert OVERLAP_MS < 5000
 
     def test_right_channel_delay(self):
         """Test RIGHT_CHANNEL_DELAY_MS is set."""
-        from weave import RIGHT_CHANNEL_DELAY_MS
-
         assert RIGHT_CHANNEL_DELAY_MS > 0
 
     def test_crossfeed(self):
         """Test CROSSFEED is in valid range."""
-        from weave import CROSSFEED
-
         assert 0 <= CROSSFEED <= 1
 
     def test_spatial_positions(self):
         """Test spatial position constants."""
-        from weave import POS_HARD_LEFT, POS_SOFT_LEFT, POS_HARD_RIGHT, POS_SOFT_RIGHT
-
         assert POS_HARD_LEFT == (1.0, 0.0)
         assert POS_HARD_RIGHT == (0.0, 1.0)
         assert POS_SOFT_LEFT[0] == 1.0
@@ -70,8 +84,6 @@ class TestWeaveConstants:
 
     def test_audio_profiles(self):
         """Test audio differentiation profiles."""
-        from weave import PROFILE_A, PROFILE_B
-
         assert "lowpass_hz" in PROFILE_A
         assert "highpass_hz" in PROFILE_A
         assert "tempo" in PROFILE_A
@@ -83,88 +95,53 @@ class TestWeaveConstants:
 class TestEstimateDuration:
     """Tests for estimate_duration function."""
 
-    def test_empty_clips(self):
-        """Test with empty clip list."""
-        from weave import estimate_duration
-
-        result = estimate_duration([], 1500, 3000)
-
-        assert result == 3000
-
-    def test_single_clip(self, tone_528hz_path):
-        """Test with single clip."""
-        from weave import estimate_duration
-
-        clip = AudioSegment.from_file(tone_528hz_path)
-        clips = [("test.wav", clip)]
+    @pytest.mark.parametrize("count", [0, 1, 3])
+    def test_sums_clips_minus_overlaps_plus_delay(self, tone_528hz_clip, count):
+        """Test empty, single and multiple clip lists against the closed form."""
+        clips = [(f"test{i}.wav", tone_528hz_clip) for i in range(count)]
 
         result = estimate_duration(clips, 1500, 3000)
 
-        expected = len(clip) + 3000
-        assert result == expected
+        overlap_reduction = max(count - 1, 0) * 1500
+        assert result == count * len(tone_528hz_clip) - overlap_reduction + 3000
 
-    def test_multiple_clips(self, tone_528hz_path):
-        """Test with multiple clips."""
-        from weave import estimate_duration
 
-        clip = AudioSegment.from_file(tone_528hz_path)
-        clips = [("test1.wav", clip), ("test2.wav", clip), ("test3.wav", clip)]
+class TestBuildClipPoolForDuration:
+    """Tests for build_clip_pool_for_duration function."""
 
-        result = estimate_duration(clips, 1500, 3000)
-
-        total_clip_ms = 3 * len(clip)
-        overlap_reduction = 2 * 1500
-        expected = total_clip_ms - overlap_reduction + 3000
-        assert result == expected
-
-
-class TestSelectClipsForDuration:
-    """Tests for select_clips_for_duration function."""
+    def test_repeats_clips_to_reach_target(self, tone_528hz_clip):
+        """Test that the pool repeats clips until the estimate reaches the target."""
+        clips = [(f"test{i}.wav", tone_528hz_clip * 3) for i in range(3)]
 
-    def test_empty_clips(self):
-        """Test with empty clip list."""
-        from weave import select_clips_for_duration
+        pool = build_clip_pool_for_duration(clips, 30000, 1500, 0)
 
-        result = select_clips_for_duration([], 10000, 1500, 3000)
+        assert len(pool) > len(clips)
+        assert abs(estimate_duration(pool, 1500, 0) - 30000) <= DURATION_TOLERANCE_MS
 
-        assert result == []
+    def test_stops_when_clips_are_shorter_than_overlap(self, tone_528hz_clip):
+        """Test that clips no longer than the overlap yield one pass instead of looping forever."""
+        short_clip = tone_528hz_clip[:1000]
+        clips = [(f"test{i}.wav", short_clip) for i in range(3)]
 
-    def test_selects_subset_for_short_duration(self, tone_528hz_path):
-        """Test that subset is selected for short target duration."""
-        from weave import select_clips_for_duration, estimate_duration
+        pool = build_clip_pool_for_duration(clips, 10000, 1500, 0)
 
-        clip = AudioSegment.from_file(tone_528hz_path)
-        clips = [(f"test{i}.wav", clip) for i in range(10)]
-
-        target_ms = 2000
-        result = select_clips_for_duration(clips, target_ms, 1500, 0)
-
-        assert len(result) > 0
-        estimated = estimate_duration(result, 1500, 0)
-        assert estimated <= target_ms + 4000
+        assert len(pool) == len(clips)
 
 
 class TestMakeMono:
     """Tests for make_mono function."""
 
-    def test_mono_clip_unchanged(self, tone_528hz_path):
+    def test_mono_clip_unchanged(self, tone_528hz_clip):
         """Test that mono clip is returned unchanged."""
-        from weave import make_mono
-
-        clip = AudioSegment.from_file(tone_528hz_path)
+        clip = tone_528hz_clip
 
         result = make_mono(clip)
 
         assert result.channels == 1
 
-    def test_stereo_clip_converted(self, tone_528hz_path):
+    def test_stereo_clip_converted(self, tone_528hz_stereo_clip):
         """Test that stereo clip is converted to mono."""
-        from weave import make_mono
-
-        mono_clip = AudioSegment.from_file(tone_528hz_path)
-        stereo_clip = AudioSegment.from_mono_audiosegments(mono_clip, mono_clip)
-
-        result = make_mono(stereo_clip)
+        result = make_mono(tone_528hz_stereo_clip)
 
         assert result.channels == 1
 
@@ -172,33 +149,27 @@ class TestMakeMono:
 class TestChangeTempo:
     """Tests for change_tempo function."""
 
-    def test_tempo_1_unchanged(self, tone_528hz_path):
+    def test_tempo_1_unchanged(self, tone_528hz_clip):
         """Test that tempo 1.0 returns clip unchanged."""
-        from weave import change_tempo
-
-        clip = AudioSegment.from_file(tone_528hz_path)
+        clip = tone_528hz_clip
         original_len = len(clip)
 
         result = change_tempo(clip, 1.0)
 
         assert len(result) == original_len
 
-    def test_tempo_faster(self, tone_528hz_path):
+    def test_tempo_faster(self, tone_528hz_clip):
         """Test that tempo > 1.0 shortens clip."""
-        from weave import change_tempo
-
-        clip = AudioSegment.from_file(tone_528hz_path)
+        clip = tone_528hz_clip
         original_len = len(clip)
 
         result = change_tempo(clip, 1.1)
 
         assert len(result) < original_len
 
-    def test_tempo_slower(self, tone_528hz_path):
+    def test_tempo_slower(self, tone_528hz_clip):
         """Test that tempo < 1.0 lengthens clip."""
-        from weave import change_tempo
-
-        clip = AudioSegment.from_file(tone_528hz_path)
+        clip = tone_528hz_clip
         original_len = len(clip)
 
         result = change_tempo(clip, 0.9)
@@ -206,44 +177,52 @@ class TestChangeTempo:
         assert len(result) > original_len
 
 
+class TestFilters:
+    """Tests for the scipy-backed low/high-pass filters."""
+
+    def test_low_pass_matches_pydub(self, tone_528hz_clip):
+        """Test that low_pass_filter reproduces pydub's RC filter exactly."""
+        result = low_pass_filter(tone_528hz_clip, 3000)
+
+        assert result.raw_data == effects.low_pass_filter(tone_528hz_clip, 3000).raw_data
+
+    def test_high_pass_matches_pydub(self, tone_528hz_stereo_clip):
+        """Test that high_pass_filter reproduces pydub's RC filter exactly, per channel."""
+        result = high_pass_filter(tone_528hz_stereo_clip, 200)
+
+        assert result.raw_data == effects.high_pass_filter(tone_528hz_stereo_clip, 200).raw_data
+
+
 class TestApplyProfile:
     """Tests for apply_profile function."""
 
-    def test_applies_lowpass(self, tone_528hz_path):
+    def test_applies_lowpass(self, tone_528hz_clip):
         """Test that lowpass filter is applied."""
-        from weave import apply_profile, PROFILE_A
-
-        clip = AudioSegment.from_file(tone_528hz_path)
+        clip = tone_528hz_clip
 
         result = apply_profile(clip, PROFILE_A, apply_tempo=False)
 
         assert len(result) == len(clip)
 
-    def test_applies_highpass(self, tone_528hz_path):
+    def test_applies_highpass(self, tone_528hz_clip):
         """Test that highpass filter is applied."""
-        from weave import apply_profile, PROFILE_B
-
-        clip = AudioSegment.from_file(tone_528hz_path)
+        clip = tone_528hz_clip
 
         result = apply_profile(clip, PROFILE_B, apply_tempo=False)
 
         assert len(result) == len(clip)
 
-    def test_applies_tempo_when_enabled(self, tone_528hz_path):
+    def test_applies_tempo_when_enabled(self, tone_528hz_clip):
         """Test that tempo is applied when enabled."""
-        from weave import apply_profile, PROFILE_A
-
-        clip = AudioSegment.from_file(tone_528hz_path)
+        clip = tone_528hz_clip
 
         result = apply_profile(clip, PROFILE_A, apply_tempo=True)
 
         assert len(result) != len(clip)
 
-    def test_skips_tempo_when_disabled(self, tone_528hz_path):
+    def test_skips_tempo_when_disabled(self, tone_528hz_clip):
         """Test that tempo is skipped when disabled."""
-        from weave import apply_profile, PROFILE_A
-
-        clip = AudioSegment.from_file(tone_528hz_path)
+        clip = tone_528hz_clip
 
         result = apply_profile(clip, PROFILE_A, apply_tempo=False)
 
@@ -253,212 +232,300 @@ class TestApplyProfile:
 class TestApplyFades:
     """Tests for apply_fades function."""
 
-    def test_applies_fade_in_out(self, tone_528hz_path):
+    def test_applies_fade_in_out(self, tone_528hz_clip):
         """Test that fades are applied."""
-        from weave import apply_fades
-
-        clip = AudioSegment.from_file(tone_528hz_path)
+        clip = tone_528hz_clip
 
         result = apply_fades(clip)
 
         assert len(result) == len(clip)
 
+    def test_matches_pydub_fades(self, tone_528hz_stereo_clip):
+        """Test that the envelope reproduces pydub's fade_in/fade_out exactly."""
+        result = apply_fades(tone_528hz_stereo_clip)
+        expected = tone_528hz_stereo_clip.fade_in(FADE_IN_MS).fade_out(FADE_OUT_MS)
+
+        assert result.raw_data == expected.raw_data
+
+
+class TestProcessClip:
+    """Tests for process_clip function."""
+
+    def test_reuses_result_for_same_clip_and_profile(self, tone_528hz_clip):
+        """Test that a repeated clip/profile pair is processed only once per cache."""
+        cache = {}
+        first = process_clip(tone_528hz_clip, PROFILE_A, apply_tempo=False, cache=cache)
+
+        assert process_clip(tone_528hz_clip, PROFILE_A, apply_tempo=False, cache=cache) is first
+        assert process_clip(tone_528hz_clip, PROFILE_B, apply_tempo=False, cache=cache) is not first
+        assert len(cache) == 2
+
+    def test_without_cache_processes_every_call(self, tone_528hz_clip):
+        """Test that no result is kept between calls when no cache is given."""
+        first = process_clip(tone_528hz_clip, PROFILE_A, apply_tempo=False)
+
+        assert process_clip(tone_528hz_clip, PROFILE_A, apply_tempo=False) is not first
+
 
 class TestPanToStereo:
     """Tests for pan_to_stereo function."""
 
-    def test_hard_left_panning(self, tone_528hz_path):
+    def test_hard_left_panning(self, tone_528hz_clip):
         """Test hard left panning."""
-        from weave import pan_to_stereo, POS_HARD_LEFT
-
-        clip = AudioSegment.from_file(tone_528hz_path)
+        clip = tone_528hz_clip
 
         result = pan_to_stereo(clip, POS_HARD_LEFT)
 
         assert result.channels == 2
 
-    def test_hard_right_panning(self, tone_528hz_path):
+    def test_hard_right_panning(self, tone_528hz_clip):
         """Test hard right panning."""
-        from weave import pan_to_stereo, POS_HARD_RIGHT
-
-        clip = AudioSegment.from_file(tone_528hz_path)
+        clip = tone_528hz_clip
 
         result = pan_to_stereo(clip, POS_HARD_RIGHT)
 
         assert result.channels == 2
 
-    def test_soft_left_panning(self, tone_528hz_path):
+    def test_soft_left_panning(self, tone_528hz_clip):
         """Test soft left panning with crossfeed."""
-        from weave import pan_to_stereo, POS_SOFT_LEFT
-
-        clip = AudioSegment.from_file(tone_528hz_path)
+        clip = tone_528hz_clip
 
         result = pan_to_stereo(clip, POS_SOFT_LEFT)
 
         assert result.channels == 2
 
-    def test_soft_right_panning(self, tone_528hz_path):
+    def test_soft_right_panning(self, tone_528hz_clip):
         """Test soft right panning with crossfeed."""
-        from weave import pan_to_stereo, POS_SOFT_RIGHT
-
-        clip = AudioSegment.from_file(tone_528hz_path)
+        clip = tone_528hz_clip
 
         result = pan_to_stereo(clip, POS_SOFT_RIGHT)
 
         assert result.channels == 2
 
+    def test_hard_left_silences_right_channel(self, tone_528hz_clip):
+        """Test that a 0.0 volume channel is true silence and 1.0 is untouched."""
+        result = pan_to_stereo(tone_528hz_clip, POS_HARD_LEFT)
+
+        left, right = result.split_to_mono()
+        assert left.raw_data == tone_528hz_clip.raw_data
+        assert right.max == 0
+
+
+class TestMixStereo:
+    """Tests for mix_stereo function."""
+
+    @staticmethod
+    def channels(segment):
+        """Return a stereo segment's (left, right) samples as lists."""
+        left, right = segment.split_to_mono()
+        return left.get_array_of_samples().tolist(), right.get_array_of_samples().tolist()
+
+    def test_places_clip_at_exact_sample_offset(self, pcm_clip):
+        """Test that start_ms lands on the matching frame with silence before it."""
+        clip = pcm_clip([100, 200, 300])
+
+        result = mix_stereo([(clip, POS_HARD_LEFT, 5)])
+
+        left, right = self.channels(result)
+        assert left == [0, 0, 0, 0, 0, 100, 200, 300]
+        assert right == [0] * 8
+
+    def test_sums_overlapping_clips(self, pcm_clip):
+        """Test that clips overlapping on one side are added sample by sample."""
+        first = pcm_clip([100, 100, 100, 100])
+        second = pcm_clip([10, 20, 30, 40])
+
+        result = mix_stereo([(first, POS_HARD_RIGHT, 0), (second, POS_HARD_RIGHT, 2)])
+
+        left, right = self.channels(result)
+        assert right == [100, 100, 110, 120, 30, 40]
+        assert left == [0] * 6
+
+    def test_clips_saturated_sum(self, pcm_clip):
+        """Test that sums beyond 16 bits clip to the sample range instead of wrapping."""
+        loud = pcm_clip([30000, -30000])
+
+        result = mix_stereo([(loud, POS_HARD_LEFT, 0), (loud, POS_HARD_LEFT, 0)])
+
+        left, _ = self.channels(result)
+        assert left == [32767, -32768]
+
+    def test_duration_pads_with_trailing_silence(self, pcm_clip):
+        """Test that a duration_ms past the last clip adds silence at the end."""
+        result = mix_stereo([(pcm_clip([500, 500]), POS_HARD_LEFT, 0)], duration_ms=5)
+
+        left, _ = self.channels(result)
+        assert left == [500, 500, 0, 0, 0]
+
+    def test_shorter_duration_does_not_truncate(self, pcm_clip):
+        """Test that a duration_ms shorter than the placements keeps every sample."""
+        result = mix_stereo([(pcm_clip([1, 2, 3, 4]), POS_HARD_LEFT, 2)], duration_ms=3)
+
+        left, _ = self.channels(result)
+        assert left == [0, 0, 1, 2, 3, 4]
+
+    def test_panned_clip_matches_pan_to_stereo(self, pcm_clip):
+        """Test that each side of a mixed clip matches pan_to_stereo, crossfeed included."""
+        clip = pcm_clip([-32768, -1001, -7, 0, 3, 999, 12345, 32767])
+
+        for position in (POS_HARD_LEFT, POS_SOFT_LEFT, POS_SOFT_RIGHT, POS_HARD_RIGHT):
+            mixed = mix_stereo([(clip, position, 0)])
+            assert self.channels(mixed) == self.channels(pan_to_stereo(clip, position))
+
+    def test_empty_placements(self):
+        """Test that no placements give an empty stereo segment, or silence for duration_ms."""
+        empty = mix_stereo([])
+        padded = mix_stereo([], duration_ms=10)
+
+        assert empty.channels == 2
+        assert len(empty.raw_data) == 0
+        assert padded.frame_rate == MIN_OUTPUT_FRAME_RATE
+        assert padded.frame_count() == MIN_OUTPUT_FRAME_RATE // 100
+        assert padded.max == 0
+
+
+class TestBuildStandardWeave:
+    """Tests for build_standard_weave function."""
+
+    def test_right_stream_starts_after_initial_delay(self, tone_528hz_clip):
+        """Test the initial clip pairs: back-to-back per side, right delayed."""
+        clips = [tone_528hz_clip] * WEAVE_INITIAL_CLIPS
+
+        placements = build_standard_weave(clips, clips, [POS_HARD_LEFT, POS_SOFT_LEFT],
+                                          [POS_HARD_RIGHT, POS_SOFT_RIGHT], start_ms=100)
+
+        length = len(placements[0][0])
+        starts = [start_ms for _, _, start_ms in placements]
+        positions = [position for _, position, _ in placements]
+        assert starts == [100, 100 + length,
+                          100 + WEAVE_INITIAL_DELAY_MS, 100 + WEAVE_INITIAL_DELAY_MS + length]
+        assert positions == [POS_HARD_LEFT, POS_SOFT_LEFT, POS_HARD_RIGHT, POS_SOFT_RIGHT]
+
+    def test_later_clips_follow_initial_streams(self, tone_528hz_clip):
+        """Test that clips past the initial pairs start once both initial streams end."""
+        clips = [tone_528hz_clip] * (WEAVE_INITIAL_CLIPS + 1)
+
+        placements = build_standard_weave(clips, clips, [POS_HARD_LEFT, POS_SOFT_LEFT],
+                                          [POS_HARD_RIGHT, POS_SOFT_RIGHT])
+
+        initial_end = max(start_ms + len(clip) for clip, _, start_ms in placements[:-2])
+        assert [start_ms for _, _, start_ms in placements[-2:]] == [
+            initial_end, initial_end + WEAVE_NORMAL_DELAY_MS
+        ]
+
+    def test_empty_side_gives_no_placements(self, tone_528hz_clip):
+        """Test that nothing is placed when one side has no clips."""
+        placements = build_standard_weave([tone_528hz_clip], [], [POS_HARD_LEFT], [POS_HARD_RIGHT])
+
+        assert placements == []
+
 
 class TestGetNextOutputPath:
     """Tests for get_next_output_path function."""
 
     def test_returns_001_when_no_existing(self, temp_dir):
         """Test returns _001 suffix when no existing files."""
-        from weave import get_next_output_path
+        result = get_next_output_path(directory=temp_dir)
 
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
+        assert result == os.path.join(temp_dir, "spoken_messages_001.wav")
 
-        try:
-            result = get_next_output_path()
-
-            assert result == "spoken_messages_001.wav"
-        finally:
-            os.chdir(original_dir)
-
-    def test_increments_sequence(self, temp_dir, tone_528hz_path):
+    def test_increments_sequence(self, temp_dir):
         """Test increments sequence number."""
-        from weave import get_next_output_path
+        # Only the filenames matter, so empty placeholders are enough
+        open(os.path.join(temp_dir, "spoken_messages_001.wav"), "wb").close()
+        open(os.path.join(temp_dir, "spoken_messages_002.wav"), "wb").close()
 
-        shutil.copy(tone_528hz_path, os.path.join(temp_dir, "spoken_messages_001.wav"))
-        shutil.copy(tone_528hz_path, os.path.join(temp_dir, "spoken_messages_002.wav"))
+        result = get_next_output_path(directory=temp_dir)
 
-        original_dir = os.getcwd()
-        os.chdir(temp_dir)
+        assert result == os.path.join(temp_dir, "spoken_messages_003.wav")
 
-        try:
-            result = get_next_output_path()
+    def test_defaults_to_bare_filename_in_cwd(self, temp_dir, monkeypatch):
+        """Test the default directory yields a bare filename for the CLI to print."""
+        monkeypatch.chdir(temp_dir)
 
-            assert result == "spoken_messages_003.wav"
-        finally:
-            os.chdir(original_dir)
+        assert get_next_output_path() == "spoken_messages_001.wav"
 
 
 class TestWeaveIntegration:
     """Integration tests for weave.py."""
 
-    def test_weave_stereo_creates_output(self, temp_dir, sample_affirmation_clips):
+    def test_weave_stereo_creates_output(self, seeded_weave_output):
         """Test that weave_stereo creates an output file."""
-        from weave import weave_stereo
-
-        output_path = os.path.join(temp_dir, "output.wav")
-
-        weave_stereo(
-            clip_paths=sample_affirmation_clips,
-            output_path=output_path,
-            seed=42
-        )
+        assert os.path.exists(seeded_weave_output)
 
-        assert os.path.exists(output_path)
-
-    def test_weave_stereo_output_is_stereo(self, temp_dir, sample_affirmation_clips):
+    def test_weave_stereo_output_is_stereo(self, seeded_weave_output, read_wav_samples):
         """Test that output is stereo."""
-        from weave import weave_stereo
-
-        output_path = os.path.join(temp_dir, "output.wav")
+        samples, _ = read_wav_samples(seeded_weave_output)
+        assert samples.shape[1] == 2
 
-        weave_stereo(
-            clip_paths=sample_affirmation_clips,
-            output_path=output_path,
-            seed=42
-        )
-
-        result = AudioSegment.from_file(output_path)
-        assert result.channels == 2
-
-    def test_weave_stereo_with_seed_is_reproducible(self, temp_dir, sample_affirmation_clips):
+    def test_weave_stereo_with_seed_is_reproducible(self, tmp_path, shared_affirmation_clips,
+                                                    seeded_weave_output, read_wav_samples):
         """Test that same seed produces same output."""
-        from weave import weave_stereo
-
-        output1 = os.path.join(temp_dir, "output1.wav")
-        output2 = os.path.join(temp_dir, "output2.wav")
+        output_path = str(tmp_path / "output.wav")
 
-        weave_stereo(clip_paths=sample_affirmation_clips, output_path=output1, seed=42)
-        weave_stereo(clip_paths=sample_affirmation_clips, output_path=output2, seed=42)
+        weave_stereo(clip_paths=shared_affirmation_clips, output_path=output_path, seed=42)
 
-        audio1 = AudioSegment.from_file(output1)
-        audio2 = AudioSegment.from_file(output2)
+        audio1, _ = read_wav_samples(seeded_weave_output)
+        audio2, _ = read_wav_samples(output_path)
 
         assert len(audio1) == len(audio2)
 
-    def test_weave_stereo_with_target_duration(self, temp_dir, sample_affirmation_clips):
+    def test_weave_stereo_with_target_duration(self, tmp_path, shared_affirmation_clips, read_wav_samples):
         """Test weaving with target duration."""
-        from weave import weave_stereo
-
-        output_path = os.path.join(temp_dir, "output.wav")
+        output_path = str(tmp_path / "output.wav")
 
         weave_stereo(
-            clip_paths=sample_affirmation_clips,
+            clip_paths=shared_affirmation_clips,
             output_path=output_path,
             seed=42,
             target_duration_s=5
         )
 
-        result = AudioSegment.from_file(output_path)
+        result, _ = read_wav_samples(output_path)
         assert len(result) > 0
 
+    def test_weave_stereo_quiet_skips_clip_listing(self, tmp_path, shared_affirmation_clips, capsys):
+        """Test that quiet drops the per-clip lines but keeps the summary."""
+        weave_stereo(clip_paths=shared_affirmation_clips, output_path=str(tmp_path / "output.wav"),
+                     seed=42, quiet=True)
+
+        out = capsys.readouterr().out
+        assert "Loaded:" not in out
+        assert "Left-side stream" not in out
+        assert "Total duration:" in out
+
+    def test_weave_stereo_with_no_clips_writes_empty_output(self, tmp_path, read_wav_samples):
+        """Test that an empty clip list gives an empty stereo file instead of raising."""
+        output_path = str(tmp_path / "output.wav")
+
+        weave_stereo(clip_paths=[], output_path=output_path, seed=42)
+
+        result, rate = read_wav_samples(output_path)
+        assert result.shape == (0, 2)
+        assert rate == MIN_OUTPUT_FRAME_RATE
+
 
 class TestWeaveCLI:
     """Tests for weave.py command-line interface."""
 
-    @pytest.mark.skipif(
-        not os.path.exists(os.path.join(PROJECT_ROOT, "venv")),
-        reason="venv not set up"
-    )
-    def test_help_flag(self, project_root):
-        """Test --help flag."""
-        venv_python = os.path.join(project_root, "venv", "bin", "python3")
-        script_path = os.path.join(project_root, "weave.py")
-
-        result = subprocess.run(
-            [venv_python, script_path, "--help"],
-            capture_output=True,
-            text=True
-        )
+    def test_help_flag(self):
+        """Test --help output."""
+        help_text = build_parser().format_help()
 
-        assert result.returncode == 0
-        assert "target-duration" in result.stdout
-        assert "seed" in result.stdout
+        assert "target-duration" in help_text
+        assert "seed" in help_text
 
-    @pytest.mark.skipif(
-        not os.path.exists(os.path.join(PROJECT_ROOT, "venv")),
-        reason="venv not set up"
-    )
-    def test_target_duration_flag_short(self, project_root):
+    def test_target_duration_flag_short(self):
         """Test -t flag is documented."""
-        venv_python = os.path.join(project_root, "venv", "bin", "python3")
-        script_path = os.path.join(project_root, "weave.py")
-
-        result = subprocess.run(
-            [venv_python, script_path, "--help"],
-            capture_output=True,
-            text=True
-        )
-
-        assert "-t" in result.stdout
+        assert "-t" in build_parser().format_help()
 
-    @pytest.mark.skipif(
-        not os.path.exists(os.path.join(PROJECT_ROOT, "venv")),
-        reason="venv not set up"
-    )
-    def test_seed_flag_short(self, project_root):
+    def test_seed_flag_short(self):
         """Test -s flag is documented."""
-        venv_python = os.path.join(project_root, "venv", "bin", "python3")
-        script_path = os.path.join(project_root, "weave.py")
+        assert "-s" in build_parser().format_help()
 
-        result = subprocess.run(
-            [venv_python, script_path, "--help"],
-            capture_output=True,
-            text=True
-        )
+    def test_quiet_flag(self):
+        """Test -q/--quiet parses to quiet=True and defaults to False."""
+        parser = build_parser()
 
-        assert "-s" in result.stdout
+        assert parser.parse_args(["-q"]).quiet
+        assert not parser.parse_args([]).quiet
@@ -12,7 +12,11 @@ import re
 import math
 import sys
 import argparse
+import wave
+import numpy as np
 from pydub import AudioSegment
+from pydub.utils import db_to_float, get_min_max_value
+from scipy.signal import lfilter
 
 
 OUTPUT_PREFIX = "spoken_messages_"
@@ -29,6 +33,7 @@ POS_SOFT_RIGHT = (CROSSFEED, 1.0)  # right + 30% left
 POS_HARD_RIGHT = (0.0, 1.0)
 
 DURATION_TOLERANCE_MS = 4000  # Accept results within 4 seconds of target
+MIN_OUTPUT_FRAME_RATE = 44100  # Lower-rate weaves are upsampled once, after mixing
 
 # Intro sequence timing
 INTRO_PAUSE_MS = 1000         # Pause after solo clips
@@ -107,22 +112,29 @@ def get_wave_intensity(time_ms):
     return 0.0
 
 
-def estimate_duration(clips, overlap_ms, delay_ms, wave_mode=False):
+def effective_overlap_ms(overlap_ms, wave_mode=False):
     """
-    Estimate final output duration for a list of clips.
+    Average overlap between consecutive clips.
 
     In wave mode, overlap only occurs during bombardment phases (~30% of time)
     and only on one channel at a time, so effective overlap is much less.
     """
+    if wave_mode:
+        return overlap_ms * BOMBARDMENT_PROBABILITY * 0.5
+    return overlap_ms
+
+
+def estimate_duration(clips, overlap_ms, delay_ms, wave_mode=False):
+    """
+    Estimate final output duration for a list of clips.
+
+    See effective_overlap_ms for how wave mode reduces the overlap.
+    """
     if not clips:
         return delay_ms
 
     total_clip_ms = sum(len(clip) for _, clip in clips)
-
-    if wave_mode:
-        effective_overlap = overlap_ms * BOMBARDMENT_PROBABILITY * 0.5
-    else:
-        effective_overlap = overlap_ms
+    effective_overlap = effective_overlap_ms(overlap_ms, wave_mode)
 
     overlap_reduction = (len(clips) - 1) * effective_overlap
     stream_duration = total_clip_ms - overlap_reduction
@@ -133,34 +145,44 @@ def estimate_duration(clips, overlap_ms, delay_ms, wave_mode=False):
 def build_clip_pool_for_duration(clips, target_ms, overlap_ms, delay_ms):
     """
     Build a clip pool that uses all clips, repeating as needed to reach target duration.
+
+    The estimate only depends on the pool's total length and clip count, so
+    passes and trimming work from running sums instead of re-estimating the
+    whole pool after every change.
     """
     if not clips:
         return []
 
     wave_mode = target_ms >= WAVE_MIN_DURATION_MS
+    overlap = effective_overlap_ms(overlap_ms, wave_mode)
+
+    def estimate(count, total_ms):
+        return total_ms - (count - 1) * overlap + delay_ms
 
     pool = clips.copy()
     random.shuffle(pool)
 
-    current_duration = estimate_duration(pool, overlap_ms, delay_ms, wave_mode)
+    pass_ms = sum(len(clip) for _, clip in clips)
+    pool_ms = pass_ms
 
-    # Keep adding full passes of shuffled clips until we reach target
-    while current_duration < target_ms:
+    # Keep adding full passes of shuffled clips until we reach target; if a
+    # pass can't add time (clips shorter than the overlap), no number will
+    pass_gain_ms = pass_ms - len(clips) * overlap
+    while pass_gain_ms > 0 and estimate(len(pool), pool_ms) < target_ms:
         additional = clips.copy()
         random.shuffle(additional)
         pool.extend(additional)
-        current_duration = estimate_duration(pool, overlap_ms, delay_ms, wave_mode)
-
-    # Trim excess clips to get closer to target
-    while len(pool) > len(clips):
-        test_pool = pool[:-1]
-        test_duration = estimate_duration(test_pool, overlap_ms, delay_ms, wave_mode)
-
-        if abs(test_duration - target_ms) < abs(current_duration - target_ms):
-            pool = test_pool
-            current_duration = test_duration
-        else:
-            break
+        pool_ms += pass_ms
+
+    # Trim excess clips to get closer to target: walking back from the end,
+    # stop at the first removal that doesn't bring the estimate closer
+    extra_ms = np.fromiter((len(clip) for _, clip in pool[len(clips):]), dtype=np.int64)
+    counts = np.arange(len(clips), len(pool) + 1)
+    totals = pass_ms + np.concatenate(([0], np.cumsum(extra_ms)))
+    errors = np.abs(estimate(counts, totals) - target_ms)
+    stops = np.flatnonzero(errors[:-1] >= errors[1:]) + 1
+    keep = stops[-1] if len(stops) else 0
+    pool = pool[:len(clips) + keep]
 
     random.shuffle(pool)
     return pool
@@ -187,20 +209,133 @@ def change_tempo(clip, tempo_factor):
     return modified.set_frame_rate(original_rate)
 
 
+def first_order_filter(clip, b, a):
+    """
+    Run a first-order IIR filter over each channel of a clip with scipy.
+    Seeded so the first output sample equals the input, like pydub's filters.
+    """
+    samples = np.asarray(clip.get_array_of_samples(), dtype=np.float64).reshape(-1, clip.channels)
+    if not len(samples):
+        return clip
+
+    filtered, _ = lfilter(b, a, samples, axis=0, zi=(1 - b[0]) * samples[:1])
+    minval, maxval = get_min_max_value(clip.sample_width * 8)
+    # astype truncates toward zero, matching pydub's int()
+    filtered = np.clip(filtered, minval, maxval).astype(clip.array_type)
+    return clip._spawn(filtered.tobytes())
+
+
+def low_pass_filter(clip, cutoff_hz):
+    """Same 6dB/octave RC low-pass as pydub's low_pass_filter, vectorized."""
+    rc = 1.0 / (cutoff_hz * 2 * math.pi)
+    dt = 1.0 / clip.frame_rate
+    alpha = dt / (rc + dt)
+    return first_order_filter(clip, [alpha], [1.0, alpha - 1.0])
+
+
+def high_pass_filter(clip, cutoff_hz):
+    """Same 6dB/octave RC high-pass as pydub's high_pass_filter, vectorized."""
+    rc = 1.0 / (cutoff_hz * 2 * math.pi)
+    dt = 1.0 / clip.frame_rate
+    alpha = rc / (rc + dt)
+    return first_order_filter(clip, [alpha, -alpha], [1.0, -alpha])
+
+
 def apply_profile(clip, profile, apply_tempo=True):
     """Apply EQ and tempo profile to a clip."""
     if profile['lowpass_hz']:
-        clip = clip.low_pass_filter(profile['lowpass_hz'])
+        clip = low_pass_filter(clip, profile['lowpass_hz'])
     if profile['highpass_hz']:
-        clip = clip.high_pass_filter(profile['highpass_hz'])
+        clip = high_pass_filter(clip, profile['highpass_hz'])
     if apply_tempo and profile['tempo'] != 1.0:
         clip = change_tempo(clip, profile['tempo'])
     return clip
 
 
+def fade_envelope(clip):
+    """
+    Per-frame gains of pydub's fade_in(FADE_IN_MS).fade_out(FADE_OUT_MS).
+
+    The fade-in steps once per frame and the fade-out once per millisecond,
+    both linear in amplitude from -120dB. Each pydub fade also trims or
+    pads the clip to its rounded millisecond length, so the envelope can be
+    a few frames shorter or longer than the clip; frames past the clip's
+    end are silence.
+    """
+    silence = db_to_float(-120)
+    frame_count = lambda ms: int(clip.frame_count(ms=ms))
+
+    # Length after fade_in, then the ms length fade_out works from
+    faded_in_frames = frame_count(len(clip))
+    faded_in_ms = round(1000 * (faded_in_frames / clip.frame_rate))
+    gains = np.ones(frame_count(faded_in_ms))
+
+    fade_in_frames = clip.frame_count(ms=FADE_IN_MS)
+    steps = np.arange(int(fade_in_frames))
+    gains[:len(steps)] = silence + (1 - silence) / fade_in_frames * steps
+
+    # First frame of each fade-out millisecond, truncated like frame_count
+    fade_out_ms = faded_in_ms - FADE_OUT_MS + np.arange(FADE_OUT_MS + 1)
+    bounds = (fade_out_ms * (clip.frame_rate / 1000.0)).astype(np.int64)
+    steps = np.repeat(np.arange(FADE_OUT_MS), np.diff(bounds))
+    gains[bounds[0]:] *= 1 + (silence - 1) / FADE_OUT_MS * steps
+
+    return gains
+
+
 def apply_fades(clip):
-    """Apply fade in/out curves for smooth transitions."""
-    return clip.fade_in(FADE_IN_MS).fade_out(FADE_OUT_MS)
+    """
+    Apply fade in/out curves for smooth transitions.
+
+    Same output as pydub's fade_in/fade_out, with the gain steps applied in
+    one envelope multiply instead of a Python loop per frame and millisecond.
+    """
+    if len(clip) < FADE_IN_MS + FADE_OUT_MS:
+        # Overlapping fades stack in pydub; too rare to be worth replicating
+        return clip.fade_in(FADE_IN_MS).fade_out(FADE_OUT_MS)
+
+    gains = fade_envelope(clip)
+    raw = np.frombuffer(clip.raw_data, dtype=clip.array_type).reshape(-1, clip.channels)
+    samples = np.zeros((len(gains), clip.channels))
+    samples[:len(raw)] = raw[:len(gains)]
+    # Floor like audioop.mul; gains never exceed 1, so nothing needs clipping
+    faded = np.floor(samples * gains[:, None]).astype(clip.array_type)
+    return clip._spawn(faded.tobytes())
+
+
+def process_clip(clip, profile, apply_tempo=True, cache=None):
+    """
+    Apply a profile and fades to a clip.
+
+    cache is a dict owned by the caller (weave_stereo keeps one per weave).
+    The same clip turns up on both sides and repeats across passes, so
+    results are stored by (id(clip), id(profile), apply_tempo) and reused.
+    Each entry holds its source clip so the id can't be recycled while cached.
+    """
+    key = (id(clip), id(profile), apply_tempo)
+    if cache is None or key not in cache:
+        processed = apply_fades(apply_profile(clip, profile, apply_tempo=apply_tempo))
+        if cache is None:
+            return processed
+        cache[key] = (clip, processed)
+    return cache[key][1]
+
+
+def pan_channel(samples, vol, sample_width):
+    """Scale mono samples for one side; clipped then floored like audioop.mul."""
+    if vol == 1.0:
+        # Full volume (the near side of every position) is the samples as-is
+        return samples
+    minval, maxval = get_min_max_value(sample_width * 8)
+    return np.floor(np.clip(samples * max(vol, 0.0), minval, maxval)).astype(samples.dtype)
+
+
+def pan_samples(samples, position, sample_width):
+    """Scale mono samples into an (N, 2) array of L,R frames."""
+    stereo = np.empty((len(samples), 2), dtype=samples.dtype)
+    for channel, vol in enumerate(position):
+        stereo[:, channel] = pan_channel(samples, vol, sample_width)
+    return stereo
 
 
 def pan_to_stereo(mono_clip, position):
@@ -209,23 +344,81 @@ def pan_to_stereo(mono_clip, position):
     position is (left_vol, right_vol) where 1.0 = full volume, 0.0 = silent.
     """
     mono_clip = make_mono(mono_clip)
-    left_vol, right_vol = position
+    # Read the raw bytes in place; get_array_of_samples would copy them twice
+    samples = np.frombuffer(mono_clip.raw_data, dtype=mono_clip.array_type)
+    stereo = pan_samples(samples, position, mono_clip.sample_width)
 
-    def vol_to_db(vol):
-        if vol <= 0:
-            return -120  # essentially silent
-        return 20 * math.log10(vol)
+    return mono_clip._spawn(stereo.tobytes(), overrides={
+        'channels': 2,
+        'frame_width': 2 * mono_clip.sample_width,
+    })
 
-    left_db = vol_to_db(left_vol)
-    right_db = vol_to_db(right_vol)
 
-    left_channel = mono_clip.apply_gain(left_db)
-    right_channel = mono_clip.apply_gain(right_db)
+def placements_end_ms(placements):
+    """Return where the latest-ending (clip, position, start_ms) placement finishes."""
+    return max((start_ms + len(clip) for clip, _, start_ms in placements), default=0)
 
-    return AudioSegment.from_mono_audiosegments(left_channel, right_channel)
+
+def mix_stereo(placements, duration_ms=0):
+    """
+    Pan and mix clips into one preallocated stereo buffer.
+
+    placements is a list of (clip, position, start_ms). Each clip stays mono
+    until it is panned straight into a single wide-integer array at its
+    offset, and the sum is clipped once, so no per-clip stereo segment is
+    built and nothing is padded, re-copied or concatenated. Formats are
+    synced the way pydub's overlay does: the highest frame rate and sample
+    width win. Clips already share one format after weave_stereo loads them,
+    which makes the sync a no-op there.
+
+    Returns a stereo AudioSegment as long as the latest-ending placement, or
+    duration_ms if that is longer (trailing silence).
+    """
+    frame_rate = max((clip.frame_rate for clip, _, _ in placements), default=MIN_OUTPUT_FRAME_RATE)
+    sample_width = max((clip.sample_width for clip, _, _ in placements), default=2)
+
+    frames = []
+    array_type = 'h'
+    for clip, position, start_ms in placements:
+        clip = make_mono(clip).set_frame_rate(frame_rate).set_sample_width(sample_width)
+        array_type = clip.array_type
+        samples = np.frombuffer(clip.raw_data, dtype=array_type)
+        frames.append((samples, position, int(start_ms * frame_rate / 1000)))
+
+    # Size the buffer once from every placement's end frame
+    starts = np.fromiter((start for _, _, start in frames), dtype=np.int64, count=len(frames))
+    lengths = np.fromiter((len(samples) for samples, _, _ in frames), dtype=np.int64, count=len(frames))
+    total = int((starts + lengths).max(initial=int(duration_ms * frame_rate / 1000)))
+    mix = np.zeros((total, 2), dtype=np.int32 if sample_width <= 2 else np.int64)
+
+    # A processed clip often sits at the soft position on both sides, so each
+    # scaled copy (in practice the CROSSFEED one) is made once per clip. Keyed
+    # by the placed clip's id, which placements keeps alive for this call
+    scaled = {}
+    for (clip, _, _), (samples, position, start) in zip(placements, frames):
+        # Accumulate each side straight into its buffer column; an (N, 2)
+        # panned copy per clip would only be summed and thrown away
+        target = mix[start:start + len(samples)]
+        for channel, vol in enumerate(position):
+            # Hard-panned clips add nothing to the far side
+            if vol > 0:
+                key = (id(clip), vol)
+                if key not in scaled:
+                    scaled[key] = pan_channel(samples, vol, sample_width)
+                target[:, channel] += scaled[key]
+
+    minval, maxval = get_min_max_value(sample_width * 8)
+    np.clip(mix, minval, maxval, out=mix)
+    return AudioSegment(
+        mix.astype(array_type).tobytes(),
+        frame_rate=frame_rate,
+        sample_width=sample_width,
+        channels=2,
+    )
 
 
-def sequence_clips_with_overlap_and_positions(clips, positions, overlap_ms, no_overlap_until_ms=0):
+def sequence_clips_with_overlap_and_positions(clips, positions, overlap_ms, no_overlap_until_ms=0,
+                                               start_ms=0, cache=None):
     """
     Sequence clips with overlap, alternating between spatial positions
     and audio profiles (EQ + tempo) for differentiation.
@@ -234,18 +427,18 @@ def sequence_clips_with_overlap_and_positions(clips, positions, overlap_ms, no_o
     and without tempo changes. After that threshold, clips overlap by overlap_ms
     and tempo differentiation kicks in.
 
-    Returns a stereo AudioSegment.
+    Returns a list of (clip, position, start_ms) placements for mix_stereo,
+    with the sequence starting at start_ms. cache is passed to process_clip.
     """
     if not clips:
-        return AudioSegment.silent(duration=0, frame_rate=44100).set_channels(2)
+        return []
 
     profiles = [PROFILE_A, PROFILE_B]
 
     # Start with first clip at first position and profile (no tempo yet)
-    processed_clip = apply_profile(clips[0], profiles[0], apply_tempo=False)
-    processed_clip = apply_fades(processed_clip)
-    result = pan_to_stereo(processed_clip, positions[0])
-    current_end = len(result)
+    processed_clip = process_clip(clips[0], profiles[0], apply_tempo=False, cache=cache)
+    placements = [(processed_clip, positions[0], start_ms)]
+    current_end = len(processed_clip)
 
     for i, clip in enumerate(clips[1:], 1):
         pos = positions[i % len(positions)]
@@ -253,9 +446,7 @@ def sequence_clips_with_overlap_and_positions(clips, positions, overlap_ms, no_o
 
         # Only apply tempo changes after we've passed the no-overlap threshold
         use_tempo = current_end > no_overlap_until_ms
-        processed_clip = apply_profile(clip, profile, apply_tempo=use_tempo)
-        processed_clip = apply_fades(processed_clip)
-        stereo_clip = pan_to_stereo(processed_clip, pos)
+        processed_clip = process_clip(clip, profile, apply_tempo=use_tempo, cache=cache)
 
         # Only overlap after we've passed the no-overlap threshold
         if current_end > no_overlap_until_ms:
@@ -266,18 +457,14 @@ def sequence_clips_with_overlap_and_positions(clips, positions, overlap_ms, no_o
         # Position where this clip starts
         start_pos = max(0, current_end - effective_overlap)
 
-        # Extend result if needed
-        end_pos = start_pos + len(stereo_clip)
-        if end_pos > len(result):
-            result += AudioSegment.silent(duration=end_pos - len(result)).set_channels(2)
-
-        result = result.overlay(stereo_clip, position=start_pos)
-        current_end = end_pos
+        placements.append((processed_clip, pos, start_ms + start_pos))
+        current_end = start_pos + len(processed_clip)
 
-    return result
+    return placements
 
 
-def build_wave_weave(left_clips, right_clips, left_positions, right_positions, start_time_ms=0):
+def build_wave_weave(left_clips, right_clips, left_positions, right_positions, start_time_ms=0,
+                     cache=None):
     """
     Build a wave-based weave where overlap intensity varies over time.
     
@@ -290,13 +477,15 @@ def build_wave_weave(left_clips, right_clips, left_positions, right_positions, s
     
     Intensity varies according to get_wave_intensity() based on time position.
     
-    Returns a stereo AudioSegment.
+    Returns a list of (clip, position, start_ms) placements for mix_stereo,
+    with the weave starting at start_time_ms. cache is passed
+    to process_clip.
     """
     if not left_clips or not right_clips:
-        return AudioSegment.silent(duration=0, frame_rate=44100).set_channels(2)
+        return []
     
     profiles = [PROFILE_A, PROFILE_B]
-    result = AudioSegment.silent(duration=0, frame_rate=44100).set_channels(2)
+    placements = []
     
     left_idx = 0
     right_idx = 0
@@ -331,9 +520,7 @@ def build_wave_weave(left_clips, right_clips, left_positions, right_positions, s
             profile = profiles[left_profile_idx % len(profiles)]
             
             use_tempo = current_time > NO_OVERLAP_DURATION_MS
-            processed_clip = apply_profile(clip, profile, apply_tempo=use_tempo)
-            processed_clip = apply_fades(processed_clip)
-            stereo_clip = pan_to_stereo(processed_clip, pos)
+            processed_clip = process_clip(clip, profile, apply_tempo=use_tempo, cache=cache)
             
             can_overlap = intensity >= 0.5 and left_owns_bombardment
             if can_overlap:
@@ -341,12 +528,8 @@ def build_wave_weave(left_clips, right_clips, left_positions, right_positions, s
             else:
                 start_pos = left_end_time
             
-            end_pos = start_pos + len(stereo_clip)
-            if end_pos > len(result):
-                result += AudioSegment.silent(duration=end_pos - len(result)).set_channels(2)
-            
-            result = result.overlay(stereo_clip, position=start_pos)
-            left_end_time = end_pos
+            placements.append((processed_clip, pos, start_time_ms + start_pos))
+            left_end_time = start_pos + len(processed_clip)
             left_idx += 1
             left_profile_idx += 1
             current_time = max(left_end_time, right_end_time)
@@ -360,9 +543,7 @@ def build_wave_weave(left_clips, right_clips, left_positions, right_positions, s
             profile = profiles[right_profile_idx % len(profiles)]
             
             use_tempo = current_time > NO_OVERLAP_DURATION_MS
-            processed_clip = apply_profile(clip, profile, apply_tempo=use_tempo)
-            processed_clip = apply_fades(processed_clip)
-            stereo_clip = pan_to_stereo(processed_clip, pos)
+            processed_clip = process_clip(clip, profile, apply_tempo=use_tempo, cache=cache)
             
             can_overlap = intensity >= 0.5 and not left_owns_bombardment
             if can_overlap:
@@ -370,12 +551,8 @@ def build_wave_weave(left_clips, right_clips, left_positions, right_positions, s
             else:
                 start_pos = right_end_time
             
-            end_pos = start_pos + len(stereo_clip)
-            if end_pos > len(result):
-                result += AudioSegment.silent(duration=end_pos - len(result)).set_channels(2)
-            
-            result = result.overlay(stereo_clip, position=start_pos)
-            right_end_time = end_pos
+            placements.append((processed_clip, pos, start_time_ms + start_pos))
+            right_end_time = start_pos + len(processed_clip)
             right_idx += 1
             right_profile_idx += 1
             current_time = max(left_end_time, right_end_time)
@@ -383,10 +560,45 @@ def build_wave_weave(left_clips, right_clips, left_positions, right_positions, s
         else:
             break
     
-    return result
+    return placements
 
 
-def build_intro(left_clips, right_clips, left_positions, right_positions):
+def build_standard_weave(left_clips, right_clips, left_positions, right_positions, start_ms=0,
+                         cache=None):
+    """
+    Build the standard (non-wave) weave: the left and right streams each
+    sequenced with overlap, the right stream delayed. The first
+    WEAVE_INITIAL_CLIPS pairs are spaced WEAVE_INITIAL_DELAY_MS apart, then
+    the rest follow with WEAVE_NORMAL_DELAY_MS once both initial streams end.
+
+    Returns a list of (clip, position, start_ms) placements for mix_stereo,
+    with the weave starting at start_ms. cache is passed
+    to process_clip.
+    """
+    placements = []
+    schedule = [
+        (left_clips[:WEAVE_INITIAL_CLIPS], right_clips[:WEAVE_INITIAL_CLIPS], WEAVE_INITIAL_DELAY_MS),
+        (left_clips[WEAVE_INITIAL_CLIPS:], right_clips[WEAVE_INITIAL_CLIPS:], WEAVE_NORMAL_DELAY_MS),
+    ]
+
+    for left, right, right_delay_ms in schedule:
+        if not left or not right:
+            break
+        left_stream = sequence_clips_with_overlap_and_positions(
+            left, left_positions, OVERLAP_MS, NO_OVERLAP_DURATION_MS, start_ms=start_ms,
+            cache=cache
+        )
+        right_stream = sequence_clips_with_overlap_and_positions(
+            right, right_positions, OVERLAP_MS, NO_OVERLAP_DURATION_MS,
+            start_ms=start_ms + right_delay_ms, cache=cache
+        )
+        placements += left_stream + right_stream
+        start_ms = placements_end_ms(left_stream + right_stream)
+
+    return placements
+
+
+def build_intro(left_clips, right_clips, left_positions, right_positions, cache=None):
     """
     Build gradual intro sequence:
     1. First clip on left alone
@@ -396,65 +608,74 @@ def build_intro(left_clips, right_clips, left_positions, right_positions):
     5. Second clip on left, with second clip on right starting halfway through
     6. Wait for both to finish, 1s pause
 
-    Returns (intro_audio, remaining_left_clips, remaining_right_clips)
+    Returns (placements, intro_duration_ms, remaining_left_clips, remaining_right_clips),
+    where placements are (clip, position, start_ms) for mix_stereo and
+    intro_duration_ms includes the trailing pause. cache is passed
+    to process_clip.
     """
     profiles = [PROFILE_A, PROFILE_B]
-    result = AudioSegment.silent(duration=0, frame_rate=44100).set_channels(2)
+    placements = []
 
     # 1. First message on left alone (profile A, hard-left, no tempo change)
-    clip1_left = apply_profile(left_clips[0], profiles[0], apply_tempo=False)
-    clip1_left = apply_fades(clip1_left)
-    clip1_left_stereo = pan_to_stereo(clip1_left, left_positions[0])
-    result += clip1_left_stereo
+    clip1_left = process_clip(left_clips[0], profiles[0], apply_tempo=False, cache=cache)
+    placements.append((clip1_left, left_positions[0], 0))
 
     # 2. 1 second pause
-    result += AudioSegment.silent(duration=INTRO_PAUSE_MS).set_channels(2)
+    current = len(clip1_left) + INTRO_PAUSE_MS
 
     # 3. First message on right alone (profile A, hard-right, no tempo change)
-    clip1_right = apply_profile(right_clips[0], profiles[0], apply_tempo=False)
-    clip1_right = apply_fades(clip1_right)
-    clip1_right_stereo = pan_to_stereo(clip1_right, right_positions[0])
-    result += clip1_right_stereo
+    clip1_right = process_clip(right_clips[0], profiles[0], apply_tempo=False, cache=cache)
+    placements.append((clip1_right, right_positions[0], current))
 
     # 4. 1 second pause
-    result += AudioSegment.silent(duration=INTRO_PAUSE_MS).set_channels(2)
+    current += len(clip1_right) + INTRO_PAUSE_MS
 
     # 5. Second message on left (profile B, soft-left, no tempo change)
-    clip2_left = apply_profile(left_clips[1], profiles[1], apply_tempo=False)
-    clip2_left = apply_fades(clip2_left)
-    clip2_left_stereo = pan_to_stereo(clip2_left, left_positions[1])
+    clip2_left = process_clip(left_clips[1], profiles[1], apply_tempo=False, cache=cache)
 
     # 6. Halfway through left, second message on right starts (profile B, soft-right, no tempo change)
-    clip2_right = apply_profile(right_clips[1], profiles[1], apply_tempo=False)
-    clip2_right = apply_fades(clip2_right)
-    clip2_right_stereo = pan_to_stereo(clip2_right, right_positions[1])
-
-    halfway = len(clip2_left_stereo) // 2
+    clip2_right = process_clip(right_clips[1], profiles[1], apply_tempo=False, cache=cache)
 
-    # Combine the paired clips
-    combined_len = max(len(clip2_left_stereo), halfway + len(clip2_right_stereo))
-    combined = clip2_left_stereo
-    if combined_len > len(combined):
-        combined += AudioSegment.silent(duration=combined_len - len(combined)).set_channels(2)
-    combined = combined.overlay(clip2_right_stereo, position=halfway)
+    halfway = len(clip2_left) // 2
 
-    result += combined
+    # Pair the clips, the right one starting halfway through the left
+    placements.append((clip2_left, left_positions[1], current))
+    placements.append((clip2_right, right_positions[1], current + halfway))
+    current += max(len(clip2_left), halfway + len(clip2_right))
 
     # 7. 1 second pause
-    result += AudioSegment.silent(duration=INTRO_FINAL_PAUSE_MS).set_channels(2)
+    current += INTRO_FINAL_PAUSE_MS
+
+    return placements, current, left_clips[2:], right_clips[2:]
 
-    return result, left_clips[2:], right_clips[2:]
+
+def format_stream_listing(title, order, side):
+    """
+    Format one stream's clip order as a single block of text, so a long
+    listing goes out in one write instead of a print per clip.
+    side is "L" or "R".
+    """
+    lines = [f"\n{title}:"]
+    for i, (name, _) in enumerate(order, 1):
+        pos = f"HARD-{side}" if (i - 1) % 2 == 0 else f"SOFT-{side}"
+        profile = "warm/slow" if (i - 1) % 2 == 0 else "bright/fast"
+        lines.append(f"  {i}. [{pos}] [{profile}] {name}")
+    return "\n".join(lines)
 
 
 def weave_stereo(
     clip_paths,
     output_path="combined_output.wav",
     seed=None,
-    target_duration_s=None
+    target_duration_s=None,
+    quiet=False
 ):
     """
     Weave audio clips into stereo with spatial positioning.
 
+    quiet skips the per-clip listings (loaded clips and both stream orders);
+    the summary lines are still printed.
+
     Intro sequence (gradual buildup):
     1. First clip plays on left alone
     2. 2s pause
@@ -478,11 +699,18 @@ def weave_stereo(
         random.seed(seed)
 
     # Load all clips
+    loaded = [AudioSegment.from_file(path) for path in clip_paths]
+
+    # Convert every clip to mono at one shared frame rate up front, so nothing
+    # downstream has to downmix or resample a clip again
+    frame_rate = max((clip.frame_rate for clip in loaded), default=MIN_OUTPUT_FRAME_RATE)
     clips = []
-    for path in clip_paths:
-        clip = AudioSegment.from_file(path)
+    for path, clip in zip(clip_paths, loaded):
+        clip = make_mono(clip).set_frame_rate(frame_rate)
         clips.append((os.path.basename(path), clip))
-        print(f"Loaded: {os.path.basename(path)} ({len(clip)/1000:.2f}s)")
+
+    if not quiet:
+        print("\n".join(f"Loaded: {name} ({len(clip)/1000:.2f}s)" for name, clip in clips))
 
     print(f"\nTotal clips available: {len(clips)}")
 
@@ -508,17 +736,9 @@ def weave_stereo(
     left_positions = [POS_HARD_LEFT, POS_SOFT_LEFT]
     right_positions = [POS_HARD_RIGHT, POS_SOFT_RIGHT]
 
-    print("\nLeft-side stream (hard-left ↔ soft-left):")
-    for i, (name, _) in enumerate(left_order, 1):
-        pos = "HARD-L" if (i - 1) % 2 == 0 else "SOFT-L"
-        profile = "warm/slow" if (i - 1) % 2 == 0 else "bright/fast"
-        print(f"  {i}. [{pos}] [{profile}] {name}")
-
-    print("\nRight-side stream (hard-right ↔ soft-right):")
-    for i, (name, _) in enumerate(right_order, 1):
-        pos = "HARD-R" if (i - 1) % 2 == 0 else "SOFT-R"
-        profile = "warm/slow" if (i - 1) % 2 == 0 else "bright/fast"
-        print(f"  {i}. [{pos}] [{profile}] {name}")
+    if not quiet:
+        print(format_stream_listing("Left-side stream (hard-left ↔ soft-left)", left_order, "L"))
+        print(format_stream_listing("Right-side stream (hard-right ↔ soft-right)", right_order, "R"))
 
     # Build audio with gradual intro
     print("\nBuilding audio (applying panning + EQ + tempo differentiation)...")
@@ -526,12 +746,20 @@ def weave_stereo(
     left_clips = [clip for _, clip in left_order]
     right_clips = [clip for _, clip in right_order]
 
+    # Every clip is placed at its offset in one shared mix buffer rather
+    # than padded, overlaid and concatenated segment by segment
+    placements = []
+    intro_duration_ms = 0
+    # Profile + fade results for this weave only; dropped when it returns
+    processed = {}
+
     if len(left_clips) >= MIN_CLIPS_FOR_INTRO and len(right_clips) >= MIN_CLIPS_FOR_INTRO:
         # Build intro with first 2 clips from each side
         print("  Building intro sequence...")
-        intro, remaining_left, remaining_right = build_intro(
-            left_clips, right_clips, left_positions, right_positions
+        intro, intro_duration_ms, remaining_left, remaining_right = build_intro(
+            left_clips, right_clips, left_positions, right_positions, cache=processed
         )
+        placements.extend(intro)
 
         if remaining_left and remaining_right:
             # Decide weaving strategy based on target or estimated duration
@@ -540,157 +768,76 @@ def weave_stereo(
             else:
                 estimated_total_ms = estimate_duration(clips, OVERLAP_MS, RIGHT_CHANNEL_DELAY_MS)
                 use_wave_pattern = estimated_total_ms >= WAVE_MIN_DURATION_MS
-            
+
             if use_wave_pattern:
                 print("  Building wave-based weave (60+ seconds detected)...")
-                intro_duration_ms = len(intro)
-                weave = build_wave_weave(
+                placements.extend(build_wave_weave(
                     remaining_left, remaining_right,
                     left_positions, right_positions,
-                    start_time_ms=intro_duration_ms
-                )
-                combined = intro + weave
+                    start_time_ms=intro_duration_ms, cache=processed
+                ))
             else:
                 print("  Building main weave (standard mode)...")
-
-                # Split into initial clips (2s delay) and rest (1s delay)
-                initial_left = remaining_left[:WEAVE_INITIAL_CLIPS]
-                initial_right = remaining_right[:WEAVE_INITIAL_CLIPS]
-                rest_left = remaining_left[WEAVE_INITIAL_CLIPS:]
-                rest_right = remaining_right[WEAVE_INITIAL_CLIPS:]
-
-                # Build initial weave section (2s delay between left/right)
-                initial_left_stream = sequence_clips_with_overlap_and_positions(
-                    initial_left, left_positions, OVERLAP_MS, NO_OVERLAP_DURATION_MS
-                )
-                initial_right_stream = sequence_clips_with_overlap_and_positions(
-                    initial_right, right_positions, OVERLAP_MS, NO_OVERLAP_DURATION_MS
-                )
-
-                # Add 2s delay to initial right stream
-                initial_right_delay = AudioSegment.silent(duration=WEAVE_INITIAL_DELAY_MS).set_channels(2)
-                initial_right_stream = initial_right_delay + initial_right_stream
-
-                # Pad and overlay initial streams
-                initial_max_len = max(len(initial_left_stream), len(initial_right_stream))
-                if len(initial_left_stream) < initial_max_len:
-                    initial_left_stream += AudioSegment.silent(duration=initial_max_len - len(initial_left_stream)).set_channels(2)
-                if len(initial_right_stream) < initial_max_len:
-                    initial_right_stream += AudioSegment.silent(duration=initial_max_len - len(initial_right_stream)).set_channels(2)
-
-                initial_weave = initial_left_stream.overlay(initial_right_stream)
-
-                # Build rest of weave (1s delay between left/right)
-                if rest_left and rest_right:
-                    rest_left_stream = sequence_clips_with_overlap_and_positions(
-                        rest_left, left_positions, OVERLAP_MS, NO_OVERLAP_DURATION_MS
-                    )
-                    rest_right_stream = sequence_clips_with_overlap_and_positions(
-                        rest_right, right_positions, OVERLAP_MS, NO_OVERLAP_DURATION_MS
-                    )
-
-                    # Add 1s delay to rest right stream
-                    rest_right_delay = AudioSegment.silent(duration=WEAVE_NORMAL_DELAY_MS).set_channels(2)
-                    rest_right_stream = rest_right_delay + rest_right_stream
-
-                    # Pad and overlay rest streams
-                    rest_max_len = max(len(rest_left_stream), len(rest_right_stream))
-                    if len(rest_left_stream) < rest_max_len:
-                        rest_left_stream += AudioSegment.silent(duration=rest_max_len - len(rest_left_stream)).set_channels(2)
-                    if len(rest_right_stream) < rest_max_len:
-                        rest_right_stream += AudioSegment.silent(duration=rest_max_len - len(rest_right_stream)).set_channels(2)
-
-                    rest_weave = rest_left_stream.overlay(rest_right_stream)
-                    weave = initial_weave + rest_weave
-                else:
-                    weave = initial_weave
-
-                # Combine intro + weave
-                combined = intro + weave
-        else:
-            # Only intro clips available
-            combined = intro
+                placements.extend(build_standard_weave(
+                    remaining_left, remaining_right,
+                    left_positions, right_positions,
+                    start_ms=intro_duration_ms, cache=processed
+                ))
     else:
         # Not enough clips for intro, fall back to simple weave with variable delay
         print("  Not enough clips for intro, using simple weave...")
+        placements.extend(build_standard_weave(
+            left_clips, right_clips, left_positions, right_positions, cache=processed
+        ))
 
-        # Split into initial clips (2s delay) and rest (1s delay)
-        initial_left = left_clips[:WEAVE_INITIAL_CLIPS]
-        initial_right = right_clips[:WEAVE_INITIAL_CLIPS]
-        rest_left = left_clips[WEAVE_INITIAL_CLIPS:]
-        rest_right = right_clips[WEAVE_INITIAL_CLIPS:]
-
-        # Build initial section with 2s delay
-        initial_left_stream = sequence_clips_with_overlap_and_positions(
-            initial_left, left_positions, OVERLAP_MS, NO_OVERLAP_DURATION_MS
-        )
-        initial_right_stream = sequence_clips_with_overlap_and_positions(
-            initial_right, right_positions, OVERLAP_MS, NO_OVERLAP_DURATION_MS
-        )
-
-        initial_right_delay = AudioSegment.silent(duration=WEAVE_INITIAL_DELAY_MS).set_channels(2)
-        initial_right_stream = initial_right_delay + initial_right_stream
-
-        initial_max_len = max(len(initial_left_stream), len(initial_right_stream))
-        if len(initial_left_stream) < initial_max_len:
-            initial_left_stream += AudioSegment.silent(duration=initial_max_len - len(initial_left_stream)).set_channels(2)
-        if len(initial_right_stream) < initial_max_len:
-            initial_right_stream += AudioSegment.silent(duration=initial_max_len - len(initial_right_stream)).set_channels(2)
-
-        combined = initial_left_stream.overlay(initial_right_stream)
-
-        # Build rest with 1s delay
-        if rest_left and rest_right:
-            rest_left_stream = sequence_clips_with_overlap_and_positions(
-                rest_left, left_positions, OVERLAP_MS, NO_OVERLAP_DURATION_MS
-            )
-            rest_right_stream = sequence_clips_with_overlap_and_positions(
-                rest_right, right_positions, OVERLAP_MS, NO_OVERLAP_DURATION_MS
-            )
-
-            rest_right_delay = AudioSegment.silent(duration=WEAVE_NORMAL_DELAY_MS).set_channels(2)
-            rest_right_stream = rest_right_delay + rest_right_stream
-
-            rest_max_len = max(len(rest_left_stream), len(rest_right_stream))
-            if len(rest_left_stream) < rest_max_len:
-                rest_left_stream += AudioSegment.silent(duration=rest_max_len - len(rest_left_stream)).set_channels(2)
-            if len(rest_right_stream) < rest_max_len:
-                rest_right_stream += AudioSegment.silent(duration=rest_max_len - len(rest_right_stream)).set_channels(2)
-
-            rest_weave = rest_left_stream.overlay(rest_right_stream)
-            combined = combined + rest_weave
+    combined = mix_stereo(placements, duration_ms=intro_duration_ms)
+    if combined.frame_rate < MIN_OUTPUT_FRAME_RATE:
+        combined = combined.set_frame_rate(MIN_OUTPUT_FRAME_RATE)
 
     print(f"\nTotal duration: {len(combined)/1000:.1f}s")
 
-    # Export
-    combined.export(output_path, format="wav")
+    # Export the PCM straight to disk; pydub's WAV export builds the whole
+    # file in a BytesIO first and then copies it out
+    with wave.open(output_path, "wb") as out:
+        out.setnchannels(combined.channels)
+        out.setsampwidth(combined.sample_width)
+        out.setframerate(combined.frame_rate)
+        out.writeframes(combined.raw_data)
     print(f"Exported: {output_path}")
 
 
-def get_next_output_path():
-    """Find the next available sequence number for the output file."""
-    existing = glob.glob(f"{OUTPUT_PREFIX}*.wav")
+def get_next_output_path(directory="."):
+    """Find the next available sequence number for the output file in directory."""
     max_seq = 0
 
-    for filename in existing:
-        basename = os.path.basename(filename)
-        match = OUTPUT_PATTERN.match(basename)
-        if match:
-            seq = int(match.group(1))
-            if seq > max_seq:
-                max_seq = seq
+    # scandir yields bare names without a stat or glob translation per entry
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                match = OUTPUT_PATTERN.match(entry.name)
+                if match:
+                    max_seq = max(max_seq, int(match.group(1)))
+    except FileNotFoundError:
+        pass
 
     next_seq = max_seq + 1
-    return f"{OUTPUT_PREFIX}{next_seq:03d}.wav"
+    return os.path.normpath(os.path.join(directory, f"{OUTPUT_PREFIX}{next_seq:03d}.wav"))
 
 
-if __name__ == "__main__":
+def build_parser():
+    """Build the command-line argument parser."""
     parser = argparse.ArgumentParser(description="Weave audio clips into stereo soundscape")
     parser.add_argument("-t", "--target-duration", type=int, default=None,
                         help="Target output duration in seconds (uses all clips if not specified)")
     parser.add_argument("-s", "--seed", type=int, default=None,
                         help="Random seed for reproducible output")
-    args = parser.parse_args()
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="Don't list every loaded clip and stream position")
+    return parser
+
+
+if __name__ == "__main__":
+    args = build_parser().parse_args()
 
     # Find all audio clips in the spoken_affirmations folder
     clip_files = sorted(glob.glob("spoken_affirmations/*.wav"))
@@ -707,7 +854,8 @@ if __name__ == "__main__":
         clip_paths=clip_files,
         output_path=output_path,
         seed=args.seed,
-        target_duration_s=args.target_duration
+        target_duration_s=args.target_duration,
+        quiet=args.quiet
     )
 
     print("\nTo play (use headphones for stereo effect):")